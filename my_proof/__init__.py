@@ -1,12 +1,13 @@
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 from my_proof.models import ProofResponse
 from my_proof.utils import remote_log
 from my_proof.proof_of_authenticity import proof_of_authenticity
-from my_proof.proof_of_uniqueness import proof_of_uniqueness
+from my_proof.proof_of_uniqueness import proof_of_uniqueness, wait_for_pending_saves
 from my_proof.proof_of_quality import proof_of_quality
 
 
@@ -19,9 +20,15 @@ class Proof:
         """Generate proofs for all input files."""
         logging.info("Starting proof generation")
         
-        authenticity = proof_of_authenticity(self.config)
-        uniqueness = proof_of_uniqueness(self.config)
-        category_scores_packed_str, category_scores = proof_of_quality(self.config)
+        # The three proofs are independent and mostly I/O bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            authenticity_future = executor.submit(proof_of_authenticity, self.config)
+            uniqueness_future = executor.submit(proof_of_uniqueness, self.config)
+            quality_future = executor.submit(proof_of_quality, self.config)
+
+            authenticity = authenticity_future.result()
+            uniqueness = uniqueness_future.result()
+            category_scores_packed_str, category_scores = quality_future.result()
 
         # # Iterate through files and calculate data validity
         # members = None
@@ -80,6 +87,8 @@ class Proof:
             '_': category_scores, # Redundant with byte array
         }
         
+        # A unique score is only final once its MinHash reached the dedupe store; a failed save fails the proof
+        wait_for_pending_saves()
         remote_log(self.config, json.dumps(self.proof_response.model_dump(), indent=2))
 
         return self.proof_response
@@ -0,0 +1,60 @@
+import hashlib
+import importlib
+import os
+import sys
+
+import pytest
+
+authenticity = importlib.import_module("my_proof.proof_of_authenticity")
+
+
+@pytest.fixture(scope="module")
+def large_file(tmp_path_factory):
+    """A file just over the direct I/O threshold, with a tail that is not block aligned."""
+    path = tmp_path_factory.mktemp("authenticity") / "large.zip"
+    block = os.urandom(1 << 20)
+    with open(path, "wb") as f:
+        for _ in range(authenticity.DIRECT_IO_MIN_SIZE >> 20):
+            f.write(block)
+        f.write(block[:12345])
+    return str(path)
+
+
+@pytest.fixture
+def direct_io_supported(large_file):
+    if sys.platform != "linux":
+        pytest.skip("O_DIRECT is Linux only")
+    try:
+        os.close(os.open(large_file, os.O_RDONLY | os.O_DIRECT))
+    except OSError:
+        pytest.skip("filesystem does not support O_DIRECT")
+
+
+def expected_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha3_256(f.read()).hexdigest()
+
+
+def test_direct_hash_matches_sha3(large_file, direct_io_supported):
+    assert os.path.getsize(large_file) > authenticity.DIRECT_IO_MIN_SIZE
+    assert authenticity._compute_file_hash_direct(large_file) == expected_digest(large_file)
+    assert authenticity.compute_file_hash(large_file) == expected_digest(large_file)
+
+
+def test_direct_hash_retries_short_reads(large_file, direct_io_supported, monkeypatch):
+    real_preadv = os.preadv
+
+    def short_preadv(fd, buffers, offset):
+        # Return at most 1 MiB per call, as a slow device may mid-file
+        (buffer,) = buffers
+        return real_preadv(fd, [memoryview(buffer)[:1 << 20]], offset)
+
+    monkeypatch.setattr(os, "preadv", short_preadv)
+    assert authenticity._compute_file_hash_direct(large_file) == expected_digest(large_file)
+
+
+def test_small_file_hash_matches_sha3(tmp_path):
+    path = tmp_path / "small.zip"
+    path.write_bytes(os.urandom(3 * authenticity.HASH_CHUNK_SIZE // 2))
+    assert authenticity.compute_file_hash(str(path)) == expected_digest(str(path))
+    assert authenticity._compute_file_hash_chunked(str(path)) == expected_digest(str(path))
@@ -15,11 +15,19 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import base64
 import csv
 import logging
+import multiprocessing
+import os
+import struct
+import sys
+import numpy as np
+from functools import partial
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any
 from pathlib import Path
-from .config import INTERESTING_FILES, get_validation_config
+from .config import INTERESTING_FILES, INTERESTING_FILES_SET, ValidationConfig, get_validation_config
 from .data_analyzers import analyze_data
 from .score_calculators import calculate_score
 from .validators import validate_sample
@@ -27,38 +35,83 @@ from .validators import validate_sample
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tag prefixed to the packed scores; untagged strings are the original hex encoding of the same bytes
+SCORES_FORMAT_VERSION = 2
+SCORES_FORMAT_TAG = f"v{SCORES_FORMAT_VERSION}:"
+
+# Below this much CSV input, starting worker processes costs more than parsing in parallel saves
+PROCESS_POOL_MIN_BYTES = 32 << 20
+
 
 def find_csv_files(unzipped_file_path: str) -> List[Path]:
     """Find all relevant CSV files in the given directory."""
-    # Get all files in the root directory
-    files = [f for f in Path(unzipped_file_path).iterdir() if f.is_file()]
-    # Filter for CSV files that match our interesting files list
-    return [f for f in files if f.suffix == ".csv" and f.name in INTERESTING_FILES]
+    # Single pass over the root directory; scandir entries carry the file type, so no extra stat per entry
+    with os.scandir(unzipped_file_path) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".csv") and entry.name in INTERESTING_FILES_SET and entry.is_file()
+        ]
+
+
+def make_file_executor(csv_files: List[Path]) -> Executor:
+    """Pick the executor used to process the CSV files of one proof."""
+    max_workers = max(1, min(8, len(csv_files)))
+    if len(csv_files) > 1 and sum(csv_file.stat().st_size for csv_file in csv_files) >= PROCESS_POOL_MIN_BYTES:
+        # Parsing and analysis hold the GIL, so large inputs are spread over processes.
+        # Spawn rather than fork: the parent already runs the proof and MinHash save threads.
+        return ProcessPoolExecutor(
+            max_workers=min(max_workers, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    # Small inputs are dominated by file I/O and the OpenAI round-trip, which threads overlap fine
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def read_csv_rows(csv_file: Path) -> List[Dict[str, str]]:
+    """Parse a CSV file into row dicts, streaming it like csv.DictReader."""
+    with open(csv_file, 'r', encoding='utf-8-sig') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return []
 
+        # Build each row dict in C straight from the reader, so only the dicts are kept in memory.
+        # Well-formed exports have one value per column; a blank or ragged row makes the strict
+        # zip raise, and the file is re-read with DictReader for its skipping and restkey/restval handling.
+        try:
+            return list(map(dict, map(partial(zip, header, strict=True), reader)))
+        except ValueError:
+            pass
 
-def process_single_file(csv_file: Path, config: Dict[str, any]) -> Dict:
-    """Process a single CSV file and return its scores."""
-    with open(csv_file, 'r', encoding='utf-8-sig') as file:
-        csv_reader = csv.DictReader(file)
-        file_data = list(csv_reader)
+        file.seek(0)
+        return list(csv.DictReader(file))
 
-    # Calculate metadata score
-    metadata = analyze_data(csv_file.name, file_data)
-    validation_config = get_validation_config(config)
-    metadata_score = calculate_score(csv_file.name, metadata, validation_config)
-    logger.info(f"Metadata score for {csv_file.name}: {metadata_score}")
+
+def process_single_file(csv_file: Path, config: Dict[str, any], validation_config: ValidationConfig = None) -> Dict:
+    """Process a single CSV file and return its scores."""
+    if validation_config is None:
+        validation_config = get_validation_config(config)
+    # Path.name is rebuilt on every access; take it once, interned like INTERESTING_FILES
+    file_name = sys.intern(csv_file.name)
+
+    # Calculate metadata score. Files below the validation minimums are still analyzed
+    # in full: their partial metadata score is packed into the proof even when is_valid is False.
+    file_data = read_csv_rows(csv_file)
+    metadata = analyze_data(file_name, file_data)
+    metadata_score = calculate_score(file_name, metadata, validation_config)
+    logger.info(f"Metadata score for {file_name}: {metadata_score}")
 
     # Calculate validation score
     if "OPENAI_API_KEY" in config and metadata_score["is_valid"]:
         logger.info("OPENAI_API_KEY is set. Performing LLM validation.")
-        validation_score = validate_sample(file_data, csv_file.name, config["OPENAI_API_KEY"], validation_config)
+        validation_score = validate_sample(file_data, file_name, config["OPENAI_API_KEY"], validation_config)
     else:
         logger.info("OPENAI_API_KEY not set or metadata invalid. Skipping LLM validation.")
         validation_score = {
             "is_valid": False,
             "score": 0,
         }
-    logger.info(f"Validation score for {csv_file.name}: {validation_score}")
+    logger.info(f"Validation score for {file_name}: {validation_score}")
 
     return {
         "metadata_score": metadata_score,
@@ -67,50 +120,51 @@ def process_single_file(csv_file: Path, config: Dict[str, any]) -> Dict:
 
 
 def quantize_scores(scores: List[float]) -> List[int]:
-    """Quantize scores to the uint16 range (0 to 255)."""
-    quantized_scores = [int(score * 255) for score in scores]
-    return quantized_scores
+    """
+    Quantize scores to the uint8 range (0 to 255).
+
+    Raises:
+        ValueError: If a score is NaN, infinite or outside the 0-1 range
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    # A NaN or out-of-range score is a scoring bug; fail instead of casting it to a valid byte
+    if not (np.isfinite(scores).all() and ((scores >= 0.0) & (scores <= 1.0)).all()):
+        raise ValueError("Scores must be finite values between 0 and 1")
+    return (scores * 255.0).astype(np.uint8).tolist()
 
 
 def pack_scores_to_bytes(metadata_scores: List[int], validation_scores: List[int]) -> bytes:
     """
-    Packs metadata and validation scores into a Big Endian byte array.
-    Each score is stored as a uint16 (2 bytes) in Big Endian format.
+    Packs metadata and validation scores into a byte array.
+    Each score is stored as a uint8 (1 byte).
     
     Format: [metadata_scores][validation_scores]
-    Each section contains scores as consecutive uint16 values.
+    Each section contains scores as consecutive uint8 values.
 
     Args:
-        metadata_scores (list of int): A list of uint16 metadata scores
-        validation_scores (list of int): A list of uint16 validation scores
+        metadata_scores (list of int): A list of uint8 metadata scores
+        validation_scores (list of int): A list of uint8 validation scores
 
     Returns:
-        bytes: A byte array containing the packed scores in Big Endian format
+        bytes: A byte array containing the packed scores
 
     Raises:
         ValueError: If the input lists are not of the same length or scores are out of range
     """
-    import struct
-
     if len(metadata_scores) != len(validation_scores):
         raise ValueError("metadata_scores and validation_scores must be the same length")
 
-    packed_bytes = b''
-
-    # Pack metadata scores in Big Endian format
-    for score in metadata_scores:
-        if not 0 <= score <= 255:
-            raise ValueError("Metadata scores must be uint16 values between 0 and 255")
-        # '>H' specifies big-endian unsigned short (2 bytes)
-        packed_bytes += struct.pack('>H', score)
-
-    # Pack validation scores in Big Endian format
-    for score in validation_scores:
-        if not 0 <= score <= 255:
-            raise ValueError("Validation scores must be uint16 values between 0 and 255")
-        packed_bytes += struct.pack('>H', score)
-
-    return packed_bytes
+    # 'B' specifies unsigned char (1 byte)
+    num_scores = len(metadata_scores) + len(validation_scores)
+    try:
+        return struct.pack(f'>{num_scores}B', *metadata_scores, *validation_scores)
+    except struct.error:
+        # struct already enforces the 0-255 range; only find the offending list on failure
+        if any(not 0 <= score <= 255 for score in metadata_scores):
+            raise ValueError("Metadata scores must be uint8 values between 0 and 255") from None
+        if any(not 0 <= score <= 255 for score in validation_scores):
+            raise ValueError("Validation scores must be uint8 values between 0 and 255") from None
+        raise
 
 
 def unpack_scores_from_bytes(packed_bytes: bytes) -> Tuple[List[int], List[int]]:
@@ -123,88 +177,11 @@ def unpack_scores_from_bytes(packed_bytes: bytes) -> Tuple[List[int], List[int]]
     Returns:
         Tuple[List[int], List[int]]: The metadata and validation scores as lists of integers.
     """
-    import struct
-
-    total_scores = len(packed_bytes) // 2  # Each uint16 is 2 bytes
+    total_scores = len(packed_bytes)  # Each uint8 is 1 byte
     num_categories = total_scores // 2
 
-    metadata_scores = []
-    validation_scores = []
-
-    # Unpack metadata scores
-    for i in range(num_categories):
-        score_bytes = packed_bytes[i*2:(i+1)*2]
-        score = struct.unpack('>H', score_bytes)[0]
-        metadata_scores.append(score)
-
-    # Unpack validation scores
-    for i in range(num_categories, num_categories*2):
-        score_bytes = packed_bytes[i*2:(i+1)*2]
-        score = struct.unpack('>H', score_bytes)[0]
-        validation_scores.append(score)
-
-    return metadata_scores, validation_scores
-
-
-def pack_scores(metadata_scores: List[int], validation_scores: List[int]) -> str:
-    if len(metadata_scores) != len(validation_scores):
-        raise ValueError("metadata_scores and validation_scores must be the same length")
-
-    packed_str = ''
-
-    # Pack metadata scores in Big Endian format
-    for score in metadata_scores:
-        if not 0 <= score <= 255:
-            raise ValueError("Metadata scores must be uint16 values between 0 and 255")
-        # '>H' specifies big-endian unsigned short (2 bytes)
-        packed_str += f"{score:02x}"
-
-    # Pack validation scores in Big Endian format
-    for score in validation_scores:
-        if not 0 <= score <= 255:
-            raise ValueError("Validation scores must be uint16 values between 0 and 255")
-        packed_str += f"{score:02x}"
-
-    return packed_str
-
-
-def unpack_scores(packed_str: str) -> Tuple[List[int], List[int]]:
-    # total_scores = len(packed_bytes) // 2  # Each uint16 is 2 bytes
-    # num_categories = total_scores // 2
-
-    # metadata_scores = []
-    # validation_scores = []
-
-    # # Unpack metadata scores
-    # for i in range(num_categories):
-    #     score_bytes = packed_bytes[i*2:(i+1)*2]
-    #     score = struct.unpack('>H', score_bytes)[0]
-    #     metadata_scores.append(score)
-
-    # # Unpack validation scores
-    # for i in range(num_categories, num_categories*2):
-    #     score_bytes = packed_bytes[i*2:(i+1)*2]
-    #     score = struct.unpack('>H', score_bytes)[0]
-    #     validation_scores.append(score)
-
-    # return metadata_scores, validation_scores
-
-    length = len(packed_str)
-    total_scores = length // 2  # Each uint16 is 2 bytes
-    num_categories = total_scores // 2
-    
-    metadata_scores = []
-    validation_scores = []
-    
-    # Unpack metadata scores
-    for i in range(0, length // 2, 2):
-        metadata_scores.append(int(packed_str[i:i + 2], 16))
-    
-    # Unpack validation scores
-    for i in range(length // 2, length, 2):
-        validation_scores.append(int(packed_str[i:i + 2], 16))
-    
-    return metadata_scores, validation_scores
+    scores = list(struct.unpack_from(f'>{num_categories * 2}B', packed_bytes))
+    return scores[:num_categories], scores[num_categories:]
 
 
 def calculate_weighted_scores(scores: Dict) -> Dict[str, Tuple[float, float]]:
@@ -213,16 +190,17 @@ def calculate_weighted_scores(scores: Dict) -> Dict[str, Tuple[float, float]]:
 
     for name in INTERESTING_FILES:
         if name in scores:
-            print(f"Processing {name}")
-            print(f"Metadata score: {scores[name]['metadata_score']}")
-            print(f"Validation score: {scores[name]['validation_openai_score']}")
+            # Skip formatting entirely unless debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing {name}")
+                logger.debug(f"Metadata score: {scores[name]['metadata_score']}")
+                logger.debug(f"Validation score: {scores[name]['validation_openai_score']}")
 
             # Both scores should already be in 0-1 range
             metadata_score = scores[name]["metadata_score"]["score"]
             validation_score = scores[name]["validation_openai_score"]["score"]
 
             weighted_scores[name] = (metadata_score, validation_score)
-            print()
 
     return weighted_scores
 
@@ -241,11 +219,19 @@ def proof_of_quality(config: Dict[str, Any]) -> Tuple[str, Dict[str, Tuple[float
     csv_files = find_csv_files(config.get('input_extracted_dir'))
     logger.info(f"Processing {len(csv_files)} CSV files")
 
-    # Process each file
+    # The validation config is invariant for the whole proof, resolve it once
+    validation_config = get_validation_config(config)
+
+    # Process files concurrently
     scores = {}
-    for csv_file in csv_files:
-        logger.info(f"Processing file: {csv_file.name}")
-        scores[csv_file.name] = process_single_file(csv_file, config)
+    with make_file_executor(csv_files) as executor:
+        futures = {}
+        for csv_file in csv_files:
+            file_name = sys.intern(csv_file.name)
+            logger.info(f"Processing file: {file_name}")
+            futures[file_name] = executor.submit(process_single_file, csv_file, config, validation_config)
+        for file_name, future in futures.items():
+            scores[file_name] = future.result()
 
     # Calculate final scores
     category_scores = calculate_weighted_scores(scores)
@@ -260,19 +246,19 @@ def proof_of_quality(config: Dict[str, Any]) -> Tuple[str, Dict[str, Tuple[float
 
 def post_process_scores(scores: Dict[str, Tuple[float, float]]) -> str:
     """
-    Encode scores into a packed byte array in Big Endian format.
-    Each score is encoded as a uint16 (2 bytes) in the following format:
-    [metadata_scores (2 bytes each)][validation_scores (2 bytes each)]
+    Encode scores into a version-tagged base64 string of a packed byte array.
+    Each score is encoded as a uint8 (1 byte) in the following format:
+    [metadata_scores (1 byte each)][validation_scores (1 byte each)]
     
     For example, with 2 files:
-    [m1_hi m1_lo][m2_hi m2_lo][v1_hi v1_lo][v2_hi v2_lo]
-    where m = metadata score, v = validation score, hi/lo = high/low bytes
+    [m1][m2][v1][v2]
+    where m = metadata score, v = validation score
 
     Args:
         scores: Dictionary of file names to (metadata_score, validation_score) tuples
 
     Returns:
-        bytes: Packed byte array containing the scores in Big Endian format
+        str: SCORES_FORMAT_TAG followed by the base64 encoding of the packed scores
     """
     # Create ordered lists of scores, using 0.0 for missing files
     ordered_metadata_scores = []
@@ -286,28 +272,36 @@ def post_process_scores(scores: Dict[str, Tuple[float, float]]) -> str:
         ordered_metadata_scores.append(metadata_score)
         ordered_validation_scores.append(validation_score)
 
-    # Quantize scores to uint16 range (0 to 255)
+    # Quantize scores to uint8 range (0 to 255)
     quantized_metadata_scores = quantize_scores(ordered_metadata_scores)
     quantized_validation_scores = quantize_scores(ordered_validation_scores)
 
-    # Pack scores into bytes using Big Endian format
-    packed_scores = pack_scores(quantized_metadata_scores, quantized_validation_scores)
+    # Pack scores into bytes
+    packed_bytes = pack_scores_to_bytes(quantized_metadata_scores, quantized_validation_scores)
 
-    return packed_scores
+    return SCORES_FORMAT_TAG + base64.b64encode(packed_bytes).decode('ascii')
 
 
 def post_process_decode(packed_scores: str) -> Dict[str, Tuple[float, float]]:
     """
-    Decode packed byte array back into scores dictionary.
+    Decode packed scores back into scores dictionary.
+
+    Accepts the current version-tagged base64 format as well as the untagged hex
+    strings written before SCORES_FORMAT_VERSION 2, which pack the same uint8 bytes.
 
     Args:
-        packed_scores: Packed byte array containing the scores
+        packed_scores: Encoded packed byte array containing the scores
 
     Returns:
         Dict[str, Tuple[float, float]]: Mapping of filenames to (metadata_score, validation_score)
     """
+    if packed_scores.startswith(SCORES_FORMAT_TAG):
+        packed_bytes = base64.b64decode(packed_scores[len(SCORES_FORMAT_TAG):], validate=True)
+    else:
+        packed_bytes = bytes.fromhex(packed_scores)
+
     # Unpack scores
-    metadata_scores, validation_scores = unpack_scores(packed_scores)
+    metadata_scores, validation_scores = unpack_scores_from_bytes(packed_bytes)
 
     # Convert quantized scores back to float in range 0.0 to 1.0
     decoded_metadata_scores = [score / 255 for score in metadata_scores]
@@ -15,81 +15,118 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from typing import Dict
-from munch import Munch, munchify
-
-validation_config: Munch = munchify(
-    {
-        "satori": {
-            # Core thresholds
-            "MIN_ORDERS": 1,
-            "MIN_TOTAL_AMOUNT": 5,
-            "MIN_UNIQUE_PRODUCTS": 1,
-            "THRESHOLD_SCORE": 10,
-            "SAMPLE_SIZE": 3,
-            "MAX_VALIDATION_CHUNK_SIZE": 4000,
-            "GPT_MODEL": "gpt-4o-mini",
-            "HALF_LIFE_DAYS": 730,
-            "ROLLOFF_EXPONENT": 1.2,
-            
-            # File-specific thresholds
-            "MIN_ITEMS": 1,
-            "MIN_DIGITAL_ITEMS": 1,
-            "MIN_LIBRARY_ITEMS": 1,
-            "MIN_UNIQUE_AUDIOBOOKS": 1,
-            "MIN_PURCHASES": 1,
-            "MIN_BILLINGS": 1,
-            "MIN_VIEWING_SESSIONS": 1,
-            "MIN_TOTAL_HOURS": 0.5,
-            "MIN_UNIQUE_TITLES": 1,
-            "MIN_DATE_RANGE_DAYS": 1,
-            "MIN_WEBSITES": 1,
-            "MIN_PAYMENT_METHODS": 1,
-            
-            # Score scaling factors
-            "SCORE_SCALING": 1.2,  # Slightly reduced for small datasets
-            "LOG_BASE": 1.8  # Increased for slower growth
-        },
+import sys
+from typing import Dict, FrozenSet, NamedTuple, Tuple
+
+
+class ValidationConfig(NamedTuple):
+    """Validation thresholds for one network, read as attributes by the scorers."""
+    # Core thresholds
+    MIN_ORDERS: int
+    MIN_TOTAL_AMOUNT: float
+    MIN_UNIQUE_PRODUCTS: int
+    THRESHOLD_SCORE: float
+    SAMPLE_SIZE: int
+    MAX_VALIDATION_CHUNK_SIZE: int
+    GPT_MODEL: str
+    HALF_LIFE_DAYS: int
+    ROLLOFF_EXPONENT: float
+
+    # File-specific thresholds
+    MIN_ITEMS: int
+    MIN_DIGITAL_ITEMS: int
+    MIN_LIBRARY_ITEMS: int
+    MIN_UNIQUE_AUDIOBOOKS: int
+    MIN_PURCHASES: int
+    MIN_BILLINGS: int
+    MIN_VIEWING_SESSIONS: int
+    MIN_TOTAL_HOURS: float
+    MIN_UNIQUE_TITLES: int
+    MIN_DATE_RANGE_DAYS: int
+    MIN_WEBSITES: int
+    MIN_PAYMENT_METHODS: int
+
+    # Score scaling factors
+    SCORE_SCALING: float
+    LOG_BASE: float
+
+    # Global minimums
+    MIN_DATA_TIME: int = 365*5  # 5 years
+    MIN_PURCHASES_PER_WEEK: int = 3  # 3 purchases per week
+
+
+validation_config: Dict[str, ValidationConfig] = {
+    "satori": ValidationConfig(
+        # Core thresholds
+        MIN_ORDERS=1,
+        MIN_TOTAL_AMOUNT=5,
+        MIN_UNIQUE_PRODUCTS=1,
+        THRESHOLD_SCORE=10,
+        SAMPLE_SIZE=3,
+        MAX_VALIDATION_CHUNK_SIZE=4000,
+        GPT_MODEL="gpt-4o-mini",
+        HALF_LIFE_DAYS=730,
+        ROLLOFF_EXPONENT=1.2,
         
-        # Mainnet - recalibrated for large datasets to score >0.8
-        "mainnet": {
-            # Core thresholds - further reduced minimums
-            "MIN_ORDERS": 2,
-            "MIN_TOTAL_AMOUNT": 20,
-            "MIN_UNIQUE_PRODUCTS": 2,
-            "THRESHOLD_SCORE": 15,
-            "SAMPLE_SIZE": 30,
-            "MAX_VALIDATION_CHUNK_SIZE": 16285,
-            "GPT_MODEL": "gpt-4o",
-            "HALF_LIFE_DAYS": 365,
-            "ROLLOFF_EXPONENT": 1.2,
-            
-            # Global minimums            
-            "MIN_DATA_TIME": 365*5, # 5 years
-            "MIN_PURCHASES_PER_WEEK": 3, # 3 purchases per week
-
-            # File-specific thresholds - lowered further
-            "MIN_ITEMS": 2,
-            "MIN_DIGITAL_ITEMS": 2,
-            "MIN_LIBRARY_ITEMS": 2,
-            "MIN_UNIQUE_AUDIOBOOKS": 2,
-            "MIN_PURCHASES": 2,
-            "MIN_BILLINGS": 1,
-            "MIN_VIEWING_SESSIONS": 2,
-            "MIN_TOTAL_HOURS": 1,
-            "MIN_UNIQUE_TITLES": 2,
-            "MIN_DATE_RANGE_DAYS": 7,
-            "MIN_WEBSITES": 1,
-            "MIN_PAYMENT_METHODS": 1,
-            
-            # Score scaling factors - significantly increased
-            "SCORE_SCALING": 2.5,  # Increased scaling for higher metadata scores
-            "LOG_BASE": 1.2  # Further reduced for faster growth
-        }
-    }
-)
-
-INTERESTING_FILES = [
+        # File-specific thresholds
+        MIN_ITEMS=1,
+        MIN_DIGITAL_ITEMS=1,
+        MIN_LIBRARY_ITEMS=1,
+        MIN_UNIQUE_AUDIOBOOKS=1,
+        MIN_PURCHASES=1,
+        MIN_BILLINGS=1,
+        MIN_VIEWING_SESSIONS=1,
+        MIN_TOTAL_HOURS=0.5,
+        MIN_UNIQUE_TITLES=1,
+        MIN_DATE_RANGE_DAYS=1,
+        MIN_WEBSITES=1,
+        MIN_PAYMENT_METHODS=1,
+        
+        # Score scaling factors
+        SCORE_SCALING=1.2,  # Slightly reduced for small datasets
+        LOG_BASE=1.8  # Increased for slower growth
+    ),
+    
+    # Mainnet - recalibrated for large datasets to score >0.8
+    "mainnet": ValidationConfig(
+        # Core thresholds - further reduced minimums
+        MIN_ORDERS=2,
+        MIN_TOTAL_AMOUNT=20,
+        MIN_UNIQUE_PRODUCTS=2,
+        THRESHOLD_SCORE=15,
+        SAMPLE_SIZE=30,
+        MAX_VALIDATION_CHUNK_SIZE=16285,
+        GPT_MODEL="gpt-4o",
+        HALF_LIFE_DAYS=365,
+        ROLLOFF_EXPONENT=1.2,
+        
+        # Global minimums            
+        MIN_DATA_TIME=365*5, # 5 years
+        MIN_PURCHASES_PER_WEEK=3, # 3 purchases per week
+
+        # File-specific thresholds - lowered further
+        MIN_ITEMS=2,
+        MIN_DIGITAL_ITEMS=2,
+        MIN_LIBRARY_ITEMS=2,
+        MIN_UNIQUE_AUDIOBOOKS=2,
+        MIN_PURCHASES=2,
+        MIN_BILLINGS=1,
+        MIN_VIEWING_SESSIONS=2,
+        MIN_TOTAL_HOURS=1,
+        MIN_UNIQUE_TITLES=2,
+        MIN_DATE_RANGE_DAYS=7,
+        MIN_WEBSITES=1,
+        MIN_PAYMENT_METHODS=1,
+        
+        # Score scaling factors - significantly increased
+        SCORE_SCALING=2.5,  # Increased scaling for higher metadata scores
+        LOG_BASE=1.2  # Further reduced for faster growth
+    ),
+}
+
+# Ordered: the position of each file determines its slot in the packed scores
+# Interned so file names interned by the callers match these keys by identity
+INTERESTING_FILES: Tuple[str, ...] = tuple(map(sys.intern, (
     "Retail.CartItems.1.csv",
     "Digital Items.csv",
     "Retail.OrderHistory.1.csv",
@@ -98,7 +135,10 @@ INTERESTING_FILES = [
     "Audible.Library.csv",
     "Audible.MembershipBillings.csv",
     "PrimeVideo.ViewingHistory.csv",
-]
+)))
+
+# For O(1) membership checks
+INTERESTING_FILES_SET: FrozenSet[str] = frozenset(INTERESTING_FILES)
 
 WEIGHT_PER_FILE = {
     "Retail.CartItems.1.csv": 1.5,
@@ -122,5 +162,5 @@ DATA_TYPE_MAP = {
     "PrimeVideo.ViewingHistory.csv": "Prime Video Viewing History",
 }
 
-def get_validation_config(config: Dict[str, any]):
+def get_validation_config(config: Dict[str, any]) -> ValidationConfig:
     return validation_config[config['network']]
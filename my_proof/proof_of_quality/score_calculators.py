@@ -16,36 +16,65 @@
 # DEALINGS IN THE SOFTWARE.
 
 from datetime import datetime
-from typing import Dict, Any
-from .utils import calculate_log_score, calculate_time_weight
+from operator import attrgetter
+from typing import Dict, Any, Optional, Tuple
+from .config import ValidationConfig
+from .utils import calculate_log_score, time_weight_from_age
 
-def calculate_score(file_name: str, metadata: dict, validation_config: Dict[str, Any]) -> dict:
+def calculate_score(file_name: str, metadata: dict, validation_config: ValidationConfig) -> dict:
     """
     Calculate score based on file type.
     Returns raw component scores without category weights.
     """
-    if file_name == "Retail.CartItems.1.csv":
-        return calculate_cart_items_score(metadata, validation_config)
-    elif file_name == "Digital Items.csv":
-        return calculate_digital_items_score(metadata, validation_config)
-    elif file_name in ["Retail.OrderHistory.1.csv", "Retail.OrderHistory.2.csv"]:
-        return calculate_retail_order_history_score(metadata, validation_config)
-    elif file_name == "Audible.PurchaseHistory.csv":
-        return calculate_audible_purchase_history_score(metadata, validation_config)
-    elif file_name == "Audible.Library.csv":
-        return calculate_audible_library_score(metadata, validation_config)
-    elif file_name == "Audible.MembershipBillings.csv":
-        return calculate_audible_membership_billings_score(metadata, validation_config)
-    elif file_name == "PrimeVideo.ViewingHistory.csv":
-        return calculate_prime_video_viewing_history_score(metadata, validation_config)
-    else:
+    # Scorers always compute the full score, even when a minimum check fails:
+    # proof_of_quality packs the metadata score of invalid files as well.
+    scorer = SCORERS.get(file_name)
+    if scorer is None:
         raise ValueError(f"Unknown file type: {file_name}")
-
-def calculate_cart_items_score(metadata: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
-    min_items = validation_config.get("MIN_ITEMS", 5)
-    min_unique_products = validation_config.get("MIN_UNIQUE_PRODUCTS", 3)
-    min_date_range_days = validation_config.get("MIN_DATE_RANGE_DAYS", 30)
-    threshold_score = validation_config["THRESHOLD_SCORE"]
+    return scorer(metadata, validation_config)
+
+# Thresholds read by calculate_retail_order_history_score, fetched in one C call
+_get_retail_thresholds = attrgetter(
+    'MIN_ORDERS', 'MIN_TOTAL_AMOUNT', 'MIN_UNIQUE_PRODUCTS', 'MIN_DATE_RANGE_DAYS',
+    'MIN_WEBSITES', 'MIN_PAYMENT_METHODS', 'THRESHOLD_SCORE',
+    'MIN_DATA_TIME', 'MIN_PURCHASES_PER_WEEK',
+)
+
+# Component weights of each scorer, in the order the components are summed; each set sums to 1
+CART_ITEMS_WEIGHTS = (0.3, 0.3, 0.2, 0.2)
+DIGITAL_ITEMS_WEIGHTS = (0.3, 0.3, 0.4)
+RETAIL_ORDER_HISTORY_WEIGHTS = (0.2, 0.2, 0.2, 0.1, 0.1, 0.1, 0.05, 0.05)
+AUDIBLE_PURCHASE_HISTORY_WEIGHTS = (0.25, 0.30, 0.25, 0.10, 0.10)
+AUDIBLE_LIBRARY_WEIGHTS = (0.40, 0.30, 0.20, 0.10)
+AUDIBLE_MEMBERSHIP_BILLINGS_WEIGHTS = (0.40, 0.40, 0.20)
+PRIME_VIDEO_VIEWING_HISTORY_WEIGHTS = (0.25, 0.25, 0.25, 0.15, 0.10)
+
+def _parse_date_range(date_range: Dict[str, Optional[str]]) -> Tuple[Optional[int], Optional[datetime]]:
+    """
+    Parse an analyzer date_range once into (whole days spanned, latest date).
+    Either is None when an end it needs is missing.
+    """
+    earliest = date_range['earliest']
+    latest = date_range['latest']
+    if not latest:
+        return None, None
+    # fromisoformat is the C inverse of the isoformat() the analyzers emit
+    latest_date = datetime.fromisoformat(latest)
+    if not earliest:
+        return None, latest_date
+    return (latest_date - datetime.fromisoformat(earliest)).days, latest_date
+
+def _time_weight(latest_date: Optional[datetime]) -> float:
+    """Time weight for data whose newest record is latest_date; 0 when there is none."""
+    if latest_date is None:
+        return 0.0
+    return time_weight_from_age((datetime.now() - latest_date).days)
+
+def calculate_cart_items_score(metadata: Dict[str, Any], validation_config: ValidationConfig) -> Dict[str, Any]:
+    min_items = validation_config.MIN_ITEMS
+    min_unique_products = validation_config.MIN_UNIQUE_PRODUCTS
+    min_date_range_days = validation_config.MIN_DATE_RANGE_DAYS
+    threshold = validation_config.THRESHOLD_SCORE * 0.01  # Scores are on a 0-1 scale
 
     # Initialize component scores (each between 0 and 1)
     num_items_score = calculate_log_score(metadata["num_items"], min_items, validation_config)
@@ -53,10 +82,10 @@ def calculate_cart_items_score(metadata: Dict[str, Any], validation_config: Dict
     date_range_score = 0
     active_ratio_score = 0
     
-    if metadata['date_range']['earliest'] and metadata['date_range']['latest']:
-        earliest = datetime.fromisoformat(metadata['date_range']['earliest'])
-        latest = datetime.fromisoformat(metadata['date_range']['latest'])
-        date_range_days = (latest - earliest).days
+    date_range_days = 0
+    span_days, latest_date = _parse_date_range(metadata['date_range'])
+    if span_days is not None:
+        date_range_days = span_days
         date_range_score = calculate_log_score(date_range_days, min_date_range_days, validation_config)
 
     active_items = metadata['cart_lists'].get('active', 0)
@@ -64,21 +93,22 @@ def calculate_cart_items_score(metadata: Dict[str, Any], validation_config: Dict
     active_ratio_score = active_items / total_items if total_items > 0 else 0
 
     # Combine scores with equal weights (sum to 1)
-    score = (num_items_score * 0.3 + 
-             unique_products_score * 0.3 + 
-             date_range_score * 0.2 + 
-             active_ratio_score * 0.2)
+    score = (num_items_score * CART_ITEMS_WEIGHTS[0] +
+             unique_products_score * CART_ITEMS_WEIGHTS[1] +
+             date_range_score * CART_ITEMS_WEIGHTS[2] +
+             active_ratio_score * CART_ITEMS_WEIGHTS[3])
 
     # Apply time weight (already 0-1)
-    time_weight, age_in_days = calculate_time_weight(metadata['date_range'])
+    time_weight = _time_weight(latest_date)
     score *= time_weight
 
-    is_valid = (
-        metadata["num_items"] >= min_items and
-        metadata["unique_products"] >= min_unique_products and
-        date_range_days >= min_date_range_days and
-        score >= threshold_score/100  # Convert threshold to 0-1 scale
+    checks = (
+        metadata["num_items"] >= min_items,
+        metadata["unique_products"] >= min_unique_products,
+        date_range_days >= min_date_range_days,
+        score >= threshold,
     )
+    is_valid = all(checks)
 
     return {
         'is_valid': is_valid,
@@ -86,11 +116,11 @@ def calculate_cart_items_score(metadata: Dict[str, Any], validation_config: Dict
         'reasons': []
     }
 
-def calculate_digital_items_score(metadata: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
-    min_items = validation_config.get("MIN_DIGITAL_ITEMS", 3)
-    min_unique_products = validation_config.get("MIN_UNIQUE_PRODUCTS", 2)
-    min_total_amount = validation_config.get("MIN_TOTAL_AMOUNT", 50)
-    threshold_score = validation_config["THRESHOLD_SCORE"]
+def calculate_digital_items_score(metadata: Dict[str, Any], validation_config: ValidationConfig) -> Dict[str, Any]:
+    min_items = validation_config.MIN_DIGITAL_ITEMS
+    min_unique_products = validation_config.MIN_UNIQUE_PRODUCTS
+    min_total_amount = validation_config.MIN_TOTAL_AMOUNT
+    threshold = validation_config.THRESHOLD_SCORE * 0.01
 
     # Initialize component scores (each between 0 and 1)
     num_items_score = calculate_log_score(metadata["num_items"], min_items, validation_config)
@@ -98,20 +128,22 @@ def calculate_digital_items_score(metadata: Dict[str, Any], validation_config: D
     total_amount_score = calculate_log_score(metadata["total_amount"], min_total_amount, validation_config)
 
     # Combine scores with weights summing to 1
-    score = (num_items_score * 0.3 +
-             unique_products_score * 0.3 +
-             total_amount_score * 0.4)
+    score = (num_items_score * DIGITAL_ITEMS_WEIGHTS[0] +
+             unique_products_score * DIGITAL_ITEMS_WEIGHTS[1] +
+             total_amount_score * DIGITAL_ITEMS_WEIGHTS[2])
 
-    # Apply time weight (already 0-1)
-    time_weight, age_in_days = calculate_time_weight(metadata['date_range'])
+    # Apply time weight (already 0-1); only the latest date is needed here
+    latest = metadata['date_range']['latest']
+    time_weight = _time_weight(datetime.fromisoformat(latest) if latest else None)
     score *= time_weight
 
-    is_valid = (
-        metadata["num_items"] >= min_items and
-        metadata["unique_products"] >= min_unique_products and
-        metadata["total_amount"] >= min_total_amount and
-        score >= threshold_score/100
+    checks = (
+        metadata["num_items"] >= min_items,
+        metadata["unique_products"] >= min_unique_products,
+        metadata["total_amount"] >= min_total_amount,
+        score >= threshold,
     )
+    is_valid = all(checks)
 
     return {
         'is_valid': is_valid,
@@ -119,80 +151,92 @@ def calculate_digital_items_score(metadata: Dict[str, Any], validation_config: D
         'reasons': []
     }
 
-def calculate_retail_order_history_score(metadata: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
-    min_orders = validation_config.get("MIN_ORDERS", 5)
-    min_total_amount = validation_config.get("MIN_TOTAL_AMOUNT", 100)
-    min_unique_products = validation_config.get("MIN_UNIQUE_PRODUCTS", 3)
-    min_date_range_days = validation_config.get("MIN_DATE_RANGE_DAYS", 30)
-    min_websites = validation_config.get("MIN_WEBSITES", 1)
-    min_payment_methods = validation_config.get("MIN_PAYMENT_METHODS", 1)
-    threshold_score = validation_config["THRESHOLD_SCORE"]
-
-    # Check global minima for order history data
-    min_data_time = validation_config.get("MIN_DATA_TIME", 365*5)  # 5 years default
-    min_purchases_per_week = validation_config.get("MIN_PURCHASES_PER_WEEK", 3)  # 3 per week default
+def calculate_retail_order_history_score(metadata: Dict[str, Any], validation_config: ValidationConfig) -> Dict[str, Any]:
+    (
+        min_orders, min_total_amount, min_unique_products, min_date_range_days,
+        min_websites, min_payment_methods, threshold_score,
+        # Global minima for order history data: 5 years, 3 purchases per week
+        min_data_time, min_purchases_per_week,
+    ) = _get_retail_thresholds(validation_config)
+    threshold = threshold_score * 0.01
+    num_orders = metadata["num_orders"]
 
     # Calculate date range and purchases per week
-    date_range_days = 0
+    date_range_days, latest_date = _parse_date_range(metadata['date_range'])
+    has_date_range = date_range_days is not None
     purchases_per_week = 0
-    
-    if metadata['date_range']['earliest'] and metadata['date_range']['latest']:
-        earliest = datetime.fromisoformat(metadata['date_range']['earliest'])
-        latest = datetime.fromisoformat(metadata['date_range']['latest'])
-        date_range_days = (latest - earliest).days
-        
-        # Calculate purchases per week
+
+    if has_date_range:
+        # Calculate purchases per week, counting a zero-day range as one week.
+        # Divide by the weeks rather than multiply by 7 / days: the rounding differs and
+        # can drop an exact 3.0 per week just below MIN_PURCHASES_PER_WEEK.
         weeks = date_range_days / 7 if date_range_days > 0 else 1
-        purchases_per_week = metadata["num_orders"] / weeks if weeks > 0 else 0
+        purchases_per_week = num_orders / weeks
+    else:
+        date_range_days = 0
 
     # Check global minima - return zero score if not met
-    if date_range_days < min_data_time or purchases_per_week < min_purchases_per_week:
+    short_date_range = date_range_days < min_data_time
+    too_few_purchases = purchases_per_week < min_purchases_per_week
+    if short_date_range or too_few_purchases:
+        reasons = []
+        if short_date_range:
+            reasons.append(f"Date range ({date_range_days} days) below minimum ({min_data_time} days)")
+        if too_few_purchases:
+            reasons.append(f"Purchases per week ({purchases_per_week:.1f}) below minimum ({min_purchases_per_week})")
         return {
             'is_valid': False,
             'score': 0.0,
-            'reasons': [
-                f"Date range ({date_range_days} days) below minimum ({min_data_time} days)" if date_range_days < min_data_time else None,
-                f"Purchases per week ({purchases_per_week:.1f}) below minimum ({min_purchases_per_week})" if purchases_per_week < min_purchases_per_week else None
-            ]
+            'reasons': reasons
         }
 
     # Rest of the scoring logic remains the same...
-    num_orders_score = calculate_log_score(metadata["num_orders"], min_orders, validation_config)
+    num_orders_score = calculate_log_score(num_orders, min_orders, validation_config)
     total_amount_score = calculate_log_score(metadata["total_amount"], min_total_amount, validation_config)
     unique_products_score = calculate_log_score(metadata["unique_products"], min_unique_products, validation_config)
     date_range_score = 0
-    websites_score = calculate_log_score(len(metadata["websites"]), min_websites, validation_config)
-    payment_methods_score = calculate_log_score(len(metadata["payment_methods"]), min_payment_methods, validation_config)
+    # Metadata built before the analyzer emitted the counts only carries the tallies themselves
+    num_websites = metadata.get("num_websites")
+    if num_websites is None:
+        num_websites = len(metadata["websites"])
+    num_payment_methods = metadata.get("num_payment_methods")
+    if num_payment_methods is None:
+        num_payment_methods = len(metadata["payment_methods"])
+    websites_score = calculate_log_score(num_websites, min_websites, validation_config)
+    payment_methods_score = calculate_log_score(num_payment_methods, min_payment_methods, validation_config)
     
-    if metadata['date_range']['earliest'] and metadata['date_range']['latest']:
+    if has_date_range:
         date_range_score = calculate_log_score(date_range_days, min_date_range_days, validation_config)
 
     # Calculate normalized ratios (0-1)
     completed_orders = metadata["order_statuses"].get("Closed", 0)
-    completion_rate = completed_orders / metadata["num_orders"] if metadata["num_orders"] > 0 else 0
-    gift_orders_rate = min(metadata["gift_orders_percentage"] / 100, 1.0)
+    completion_rate = completed_orders / num_orders if num_orders > 0 else 0
+    gift_orders_rate = metadata["gift_orders_percentage"] * 0.01
+    if gift_orders_rate > 1.0:
+        gift_orders_rate = 1.0
 
     # Combine scores with weights summing to 1
-    score = (num_orders_score * 0.2 +
-             total_amount_score * 0.2 +
-             unique_products_score * 0.2 +
-             date_range_score * 0.1 +
-             websites_score * 0.1 +
-             payment_methods_score * 0.1 +
-             completion_rate * 0.05 +
-             gift_orders_rate * 0.05)
+    score = (num_orders_score * RETAIL_ORDER_HISTORY_WEIGHTS[0] +
+             total_amount_score * RETAIL_ORDER_HISTORY_WEIGHTS[1] +
+             unique_products_score * RETAIL_ORDER_HISTORY_WEIGHTS[2] +
+             date_range_score * RETAIL_ORDER_HISTORY_WEIGHTS[3] +
+             websites_score * RETAIL_ORDER_HISTORY_WEIGHTS[4] +
+             payment_methods_score * RETAIL_ORDER_HISTORY_WEIGHTS[5] +
+             completion_rate * RETAIL_ORDER_HISTORY_WEIGHTS[6] +
+             gift_orders_rate * RETAIL_ORDER_HISTORY_WEIGHTS[7])
 
     # Apply time weight
-    time_weight, age_in_days = calculate_time_weight(metadata['date_range'])
+    time_weight = _time_weight(latest_date)
     score *= time_weight
 
-    is_valid = (
-        metadata["num_orders"] >= min_orders and
-        metadata["total_amount"] >= min_total_amount and
-        metadata["unique_products"] >= min_unique_products and
-        date_range_days >= min_date_range_days and
-        score >= threshold_score/100
+    checks = (
+        num_orders >= min_orders,
+        metadata["total_amount"] >= min_total_amount,
+        metadata["unique_products"] >= min_unique_products,
+        date_range_days >= min_date_range_days,
+        score >= threshold,
     )
+    is_valid = all(checks)
 
     return {
         'is_valid': is_valid,
@@ -200,12 +244,12 @@ def calculate_retail_order_history_score(metadata: Dict[str, Any], validation_co
         'reasons': []
     }
 
-def calculate_audible_purchase_history_score(metadata: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
-    min_purchases = validation_config.get("MIN_PURCHASES", 5)
-    min_total_amount = validation_config.get("MIN_TOTAL_AMOUNT", 75)
-    min_unique_audiobooks = validation_config.get("MIN_UNIQUE_AUDIOBOOKS", 3)
-    min_date_range_days = validation_config.get("MIN_DATE_RANGE_DAYS", 60)
-    threshold_score = validation_config["THRESHOLD_SCORE"]
+def calculate_audible_purchase_history_score(metadata: Dict[str, Any], validation_config: ValidationConfig) -> Dict[str, Any]:
+    min_purchases = validation_config.MIN_PURCHASES
+    min_total_amount = validation_config.MIN_TOTAL_AMOUNT
+    min_unique_audiobooks = validation_config.MIN_UNIQUE_AUDIOBOOKS
+    min_date_range_days = validation_config.MIN_DATE_RANGE_DAYS
+    threshold = validation_config.THRESHOLD_SCORE * 0.01
 
     # Initialize component scores (each between 0 and 1)
     num_purchases_score = calculate_log_score(metadata["num_purchases"], min_purchases, validation_config)
@@ -214,30 +258,31 @@ def calculate_audible_purchase_history_score(metadata: Dict[str, Any], validatio
     date_range_score = 0
     purchase_types_score = calculate_log_score(len(metadata["purchase_types"]), 2, validation_config)
 
-    if metadata['date_range']['earliest'] and metadata['date_range']['latest']:
-        earliest = datetime.fromisoformat(metadata['date_range']['earliest'])
-        latest = datetime.fromisoformat(metadata['date_range']['latest'])
-        date_range_days = (latest - earliest).days
+    date_range_days = 0
+    span_days, latest_date = _parse_date_range(metadata['date_range'])
+    if span_days is not None:
+        date_range_days = span_days
         date_range_score = calculate_log_score(date_range_days, min_date_range_days, validation_config)
 
     # Combine scores with weights summing to 1
-    score = (num_purchases_score * 0.25 +
-             total_amount_score * 0.30 +
-             unique_audiobooks_score * 0.25 +
-             date_range_score * 0.10 +
-             purchase_types_score * 0.10)
+    score = (num_purchases_score * AUDIBLE_PURCHASE_HISTORY_WEIGHTS[0] +
+             total_amount_score * AUDIBLE_PURCHASE_HISTORY_WEIGHTS[1] +
+             unique_audiobooks_score * AUDIBLE_PURCHASE_HISTORY_WEIGHTS[2] +
+             date_range_score * AUDIBLE_PURCHASE_HISTORY_WEIGHTS[3] +
+             purchase_types_score * AUDIBLE_PURCHASE_HISTORY_WEIGHTS[4])
 
     # Apply time weight
-    time_weight, age_in_days = calculate_time_weight(metadata['date_range'])
+    time_weight = _time_weight(latest_date)
     score *= time_weight
 
-    is_valid = (
-        metadata["num_purchases"] >= min_purchases and
-        metadata["total_amount_spent"] >= min_total_amount and
-        metadata["unique_audiobooks"] >= min_unique_audiobooks and
-        date_range_days >= min_date_range_days and
-        score >= threshold_score/100
+    checks = (
+        metadata["num_purchases"] >= min_purchases,
+        metadata["total_amount_spent"] >= min_total_amount,
+        metadata["unique_audiobooks"] >= min_unique_audiobooks,
+        date_range_days >= min_date_range_days,
+        score >= threshold,
     )
+    is_valid = all(checks)
 
     return {
         'is_valid': is_valid,
@@ -245,21 +290,21 @@ def calculate_audible_purchase_history_score(metadata: Dict[str, Any], validatio
         'reasons': []
     }
 
-def calculate_audible_library_score(metadata: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
-    min_library_items = validation_config.get("MIN_LIBRARY_ITEMS", 10)
-    min_unique_audiobooks = validation_config.get("MIN_UNIQUE_AUDIOBOOKS", 5)
-    min_date_range_days = validation_config.get("MIN_DATE_RANGE_DAYS", 90)
-    threshold_score = validation_config["THRESHOLD_SCORE"]
+def calculate_audible_library_score(metadata: Dict[str, Any], validation_config: ValidationConfig) -> Dict[str, Any]:
+    min_library_items = validation_config.MIN_LIBRARY_ITEMS
+    min_unique_audiobooks = validation_config.MIN_UNIQUE_AUDIOBOOKS
+    min_date_range_days = validation_config.MIN_DATE_RANGE_DAYS
+    threshold = validation_config.THRESHOLD_SCORE * 0.01
 
     # Initialize component scores (each between 0 and 1)
     num_items_score = calculate_log_score(metadata["num_items_in_library"], min_library_items, validation_config)
     unique_audiobooks_score = calculate_log_score(metadata["unique_audiobooks"], min_unique_audiobooks, validation_config)
     date_range_score = 0
     
-    if metadata['date_range']['earliest'] and metadata['date_range']['latest']:
-        earliest = datetime.fromisoformat(metadata['date_range']['earliest'])
-        latest = datetime.fromisoformat(metadata['date_range']['latest'])
-        date_range_days = (latest - earliest).days
+    date_range_days = 0
+    span_days, latest_date = _parse_date_range(metadata['date_range'])
+    if span_days is not None:
+        date_range_days = span_days
         date_range_score = calculate_log_score(date_range_days, min_date_range_days, validation_config)
 
     # Calculate downloaded ratio (already 0-1)
@@ -268,21 +313,22 @@ def calculate_audible_library_score(metadata: Dict[str, Any], validation_config:
     downloaded_ratio = downloaded_yes / total_items if total_items > 0 else 0
 
     # Combine scores with weights summing to 1
-    score = (num_items_score * 0.40 +
-             unique_audiobooks_score * 0.30 +
-             date_range_score * 0.20 +
-             downloaded_ratio * 0.10)
+    score = (num_items_score * AUDIBLE_LIBRARY_WEIGHTS[0] +
+             unique_audiobooks_score * AUDIBLE_LIBRARY_WEIGHTS[1] +
+             date_range_score * AUDIBLE_LIBRARY_WEIGHTS[2] +
+             downloaded_ratio * AUDIBLE_LIBRARY_WEIGHTS[3])
 
     # Apply time weight
-    time_weight, age_in_days = calculate_time_weight(metadata['date_range'])
+    time_weight = _time_weight(latest_date)
     score *= time_weight
 
-    is_valid = (
-        metadata["num_items_in_library"] >= min_library_items and
-        metadata["unique_audiobooks"] >= min_unique_audiobooks and
-        date_range_days >= min_date_range_days and
-        score >= threshold_score/100
+    checks = (
+        metadata["num_items_in_library"] >= min_library_items,
+        metadata["unique_audiobooks"] >= min_unique_audiobooks,
+        date_range_days >= min_date_range_days,
+        score >= threshold,
     )
+    is_valid = all(checks)
 
     return {
         'is_valid': is_valid,
@@ -290,38 +336,39 @@ def calculate_audible_library_score(metadata: Dict[str, Any], validation_config:
         'reasons': []
     }
 
-def calculate_audible_membership_billings_score(metadata: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
-    min_billings = validation_config.get("MIN_BILLINGS", 3)
-    min_total_amount = validation_config.get("MIN_TOTAL_AMOUNT", 30)
-    min_date_range_days = validation_config.get("MIN_DATE_RANGE_DAYS", 90)
-    threshold_score = validation_config["THRESHOLD_SCORE"]
+def calculate_audible_membership_billings_score(metadata: Dict[str, Any], validation_config: ValidationConfig) -> Dict[str, Any]:
+    min_billings = validation_config.MIN_BILLINGS
+    min_total_amount = validation_config.MIN_TOTAL_AMOUNT
+    min_date_range_days = validation_config.MIN_DATE_RANGE_DAYS
+    threshold = validation_config.THRESHOLD_SCORE * 0.01
 
     # Initialize component scores (each between 0 and 1)
     num_billings_score = calculate_log_score(metadata["num_billings"], min_billings, validation_config)
     total_amount_score = calculate_log_score(metadata["total_amount_spent"], min_total_amount, validation_config)
     date_range_score = 0
 
-    if metadata['date_range']['earliest'] and metadata['date_range']['latest']:
-        earliest = datetime.fromisoformat(metadata['date_range']['earliest'])
-        latest = datetime.fromisoformat(metadata['date_range']['latest'])
-        date_range_days = (latest - earliest).days
+    date_range_days = 0
+    span_days, latest_date = _parse_date_range(metadata['date_range'])
+    if span_days is not None:
+        date_range_days = span_days
         date_range_score = calculate_log_score(date_range_days, min_date_range_days, validation_config)
 
     # Combine scores with weights summing to 1
-    score = (num_billings_score * 0.40 +
-             total_amount_score * 0.40 +
-             date_range_score * 0.20)
+    score = (num_billings_score * AUDIBLE_MEMBERSHIP_BILLINGS_WEIGHTS[0] +
+             total_amount_score * AUDIBLE_MEMBERSHIP_BILLINGS_WEIGHTS[1] +
+             date_range_score * AUDIBLE_MEMBERSHIP_BILLINGS_WEIGHTS[2])
 
     # Apply time weight
-    time_weight, age_in_days = calculate_time_weight(metadata['date_range'])
+    time_weight = _time_weight(latest_date)
     score *= time_weight
 
-    is_valid = (
-        metadata["num_billings"] >= min_billings and
-        metadata["total_amount_spent"] >= min_total_amount and
-        date_range_days >= min_date_range_days and
-        score >= threshold_score/100
+    checks = (
+        metadata["num_billings"] >= min_billings,
+        metadata["total_amount_spent"] >= min_total_amount,
+        date_range_days >= min_date_range_days,
+        score >= threshold,
     )
+    is_valid = all(checks)
 
     return {
         'is_valid': is_valid,
@@ -329,12 +376,12 @@ def calculate_audible_membership_billings_score(metadata: Dict[str, Any], valida
         'reasons': []
     }
 
-def calculate_prime_video_viewing_history_score(metadata: Dict[str, Any], validation_config: Dict[str, Any]) -> Dict[str, Any]:
-    min_viewing_sessions = validation_config.get("MIN_VIEWING_SESSIONS", 5)
-    min_total_hours = validation_config.get("MIN_TOTAL_HOURS", 10)
-    min_unique_titles = validation_config.get("MIN_UNIQUE_TITLES", 3)
-    min_date_range_days = validation_config.get("MIN_DATE_RANGE_DAYS", 60)
-    threshold_score = validation_config["THRESHOLD_SCORE"]
+def calculate_prime_video_viewing_history_score(metadata: Dict[str, Any], validation_config: ValidationConfig) -> Dict[str, Any]:
+    min_viewing_sessions = validation_config.MIN_VIEWING_SESSIONS
+    min_total_hours = validation_config.MIN_TOTAL_HOURS
+    min_unique_titles = validation_config.MIN_UNIQUE_TITLES
+    min_date_range_days = validation_config.MIN_DATE_RANGE_DAYS
+    threshold = validation_config.THRESHOLD_SCORE * 0.01
 
     # Initialize component scores (each between 0 and 1)
     sessions_score = calculate_log_score(metadata["num_viewing_sessions"], min_viewing_sessions, validation_config)
@@ -343,33 +390,46 @@ def calculate_prime_video_viewing_history_score(metadata: Dict[str, Any], valida
     date_range_score = 0
     devices_score = calculate_log_score(len(metadata["devices_used"]), 2, validation_config)
 
-    if metadata['date_range']['earliest'] and metadata['date_range']['latest']:
-        earliest = datetime.fromisoformat(metadata['date_range']['earliest'])
-        latest = datetime.fromisoformat(metadata['date_range']['latest'])
-        date_range_days = (latest - earliest).days
+    date_range_days = 0
+    span_days, latest_date = _parse_date_range(metadata['date_range'])
+    if span_days is not None:
+        date_range_days = span_days
         date_range_score = calculate_log_score(date_range_days, min_date_range_days, validation_config)
 
     # Combine scores with weights summing to 1
-    score = (sessions_score * 0.25 +
-             hours_score * 0.25 +
-             titles_score * 0.25 +
-             date_range_score * 0.15 +
-             devices_score * 0.10)
+    score = (sessions_score * PRIME_VIDEO_VIEWING_HISTORY_WEIGHTS[0] +
+             hours_score * PRIME_VIDEO_VIEWING_HISTORY_WEIGHTS[1] +
+             titles_score * PRIME_VIDEO_VIEWING_HISTORY_WEIGHTS[2] +
+             date_range_score * PRIME_VIDEO_VIEWING_HISTORY_WEIGHTS[3] +
+             devices_score * PRIME_VIDEO_VIEWING_HISTORY_WEIGHTS[4])
 
     # Apply time weight
-    time_weight, age_in_days = calculate_time_weight(metadata['date_range'])
+    time_weight = _time_weight(latest_date)
     score *= time_weight
 
-    is_valid = (
-        metadata["num_viewing_sessions"] >= min_viewing_sessions and
-        metadata["total_hours_viewed"] >= min_total_hours and
-        metadata["unique_titles_watched"] >= min_unique_titles and
-        date_range_days >= min_date_range_days and
-        score >= threshold_score/100
+    checks = (
+        metadata["num_viewing_sessions"] >= min_viewing_sessions,
+        metadata["total_hours_viewed"] >= min_total_hours,
+        metadata["unique_titles_watched"] >= min_unique_titles,
+        date_range_days >= min_date_range_days,
+        score >= threshold,
     )
+    is_valid = all(checks)
 
     return {
         'is_valid': is_valid,
         'score': score,
         'reasons': []
     }
+
+# Scorer for each supported file, resolved with one dict lookup per file
+SCORERS = {
+    "Retail.CartItems.1.csv": calculate_cart_items_score,
+    "Digital Items.csv": calculate_digital_items_score,
+    "Retail.OrderHistory.1.csv": calculate_retail_order_history_score,
+    "Retail.OrderHistory.2.csv": calculate_retail_order_history_score,
+    "Audible.PurchaseHistory.csv": calculate_audible_purchase_history_score,
+    "Audible.Library.csv": calculate_audible_library_score,
+    "Audible.MembershipBillings.csv": calculate_audible_membership_billings_score,
+    "PrimeVideo.ViewingHistory.csv": calculate_prime_video_viewing_history_score,
+}
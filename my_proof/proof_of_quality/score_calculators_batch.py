@@ -0,0 +1,111 @@
+# The MIT License (MIT)
+# Copyright © 2024 PrimeInsightsDAO, philanthrope
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Vectorized counterparts of the scorers in score_calculators, for scoring many
+records at once. Each input is a 1-D array with one entry per record; a missing
+date range is encoded as NaN in date_range_days and age_in_days.
+"""
+
+import numpy as np
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+from .config import ValidationConfig
+from .score_calculators import CART_ITEMS_WEIGHTS
+from .utils import calculate_time_weight_vec
+
+_ONE_DAY = np.timedelta64(1, 'D')
+# ln(11), the normalizer every log score column divides by
+_LOG1P_10 = np.log1p(10)
+
+def _parse_iso_dates(values: Sequence[Optional[str]]) -> np.ndarray:
+    """Parse analyzer isoformat() strings in one NumPy pass; None becomes NaT."""
+    return np.asarray(values, dtype='datetime64[us]')
+
+def _whole_days(deltas: np.ndarray) -> np.ndarray:
+    """Floor timedelta64 values to whole days like timedelta.days, with NaN for NaT."""
+    with np.errstate(invalid='ignore'):
+        days = (deltas // _ONE_DAY).astype(np.float64)
+    days[np.isnat(deltas)] = np.nan
+    return days
+
+def calculate_date_range_days_batch(earliest: Sequence[Optional[str]], latest: Sequence[Optional[str]]) -> np.ndarray:
+    """Array version of the day span from score_calculators._parse_date_range."""
+    return _whole_days(_parse_iso_dates(latest) - _parse_iso_dates(earliest))
+
+def calculate_age_in_days_batch(latest: Sequence[Optional[str]], current_date: datetime = None) -> np.ndarray:
+    """Whole days from each latest date to current_date (now by default), as in score_calculators._time_weight."""
+    if current_date is None:
+        current_date = datetime.now()
+    return _whole_days(np.datetime64(current_date, 'us') - _parse_iso_dates(latest))
+
+def calculate_log_scores(values: np.ndarray, min_value, validation_config: ValidationConfig) -> np.ndarray:
+    """
+    Array version of utils.calculate_log_score.
+    min_value may be an array broadcasting against values, e.g. one minimum per row of a stack of columns.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    min_value = np.asarray(min_value, dtype=np.float64)
+
+    # NaN > 0 is False, so missing values score 0 like non-positive ones
+    scored = (values > 0) & (min_value > 0)
+    ratios = np.divide(values, min_value, out=np.zeros(scored.shape), where=scored)
+    log_scores = np.log1p(ratios) / _LOG1P_10
+    log_scores *= validation_config.SCORE_SCALING
+
+    return np.where(scored, np.clip(log_scores, 0.0, 1.0), 0.0)
+
+def calculate_cart_items_scores_batch(meta_arrays: Dict[str, np.ndarray], validation_config: ValidationConfig) -> Dict[str, np.ndarray]:
+    """
+    Score many cart item records at once.
+    meta_arrays holds num_items, unique_products, date_range_days, active_items and age_in_days.
+    """
+    num_items = np.asarray(meta_arrays['num_items'], dtype=np.float64)
+    unique_products = np.asarray(meta_arrays['unique_products'], dtype=np.float64)
+    date_range_days = np.asarray(meta_arrays['date_range_days'], dtype=np.float64)
+    active_items = np.asarray(meta_arrays['active_items'], dtype=np.float64)
+
+    min_items = validation_config.MIN_ITEMS
+    min_unique_products = validation_config.MIN_UNIQUE_PRODUCTS
+    min_date_range_days = validation_config.MIN_DATE_RANGE_DAYS
+    threshold = validation_config.THRESHOLD_SCORE * 0.01
+
+    # Score the three log-scaled columns in one pass, one minimum per row
+    num_items_score, unique_products_score, date_range_score = calculate_log_scores(
+        np.stack((num_items, unique_products, date_range_days)),
+        np.array((min_items, min_unique_products, min_date_range_days))[:, np.newaxis],
+        validation_config,
+    )
+    active_ratio_score = np.divide(active_items, num_items, out=np.zeros_like(num_items), where=num_items > 0)
+
+    scores = (num_items_score * CART_ITEMS_WEIGHTS[0] +
+              unique_products_score * CART_ITEMS_WEIGHTS[1] +
+              date_range_score * CART_ITEMS_WEIGHTS[2] +
+              active_ratio_score * CART_ITEMS_WEIGHTS[3])
+    scores *= calculate_time_weight_vec(meta_arrays['age_in_days'])
+
+    is_valid = (
+        (num_items >= min_items) &
+        (unique_products >= min_unique_products) &
+        (date_range_days >= min_date_range_days) &
+        (scores >= threshold)
+    )
+
+    return {
+        'is_valid': is_valid,
+        'score': scores,
+    }
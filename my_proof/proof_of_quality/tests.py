@@ -1,4 +1,49 @@
-from my_proof.proof_of_quality import pack_scores, unpack_scores
+import csv
+import importlib
+import random
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from my_proof.proof_of_quality import (
+    INTERESTING_FILES,
+    find_csv_files,
+    make_file_executor,
+    pack_scores_to_bytes,
+    post_process_decode,
+    post_process_scores,
+    process_single_file,
+    quantize_scores,
+    read_csv_rows,
+    unpack_scores_from_bytes,
+)
+from my_proof.proof_of_quality.config import get_validation_config
+from my_proof.proof_of_quality.score_calculators import calculate_cart_items_score, calculate_retail_order_history_score
+from my_proof.proof_of_quality.score_calculators_batch import (
+    calculate_age_in_days_batch,
+    calculate_cart_items_scores_batch,
+    calculate_date_range_days_batch,
+    calculate_log_scores,
+)
+from my_proof.proof_of_quality.utils import calculate_log_score, parse_date
+
+quality = importlib.import_module("my_proof.proof_of_quality")
+
+DEMO_ZIP = Path(__file__).resolve().parents[2] / "demo" / "input" / "Your Orders.zip"
+
+@pytest.fixture(scope="module")
+def demo_csv_dir(tmp_path_factory):
+    """The demo export's CSV files, flattened into one directory like input_extracted_dir."""
+    extracted_dir = tmp_path_factory.mktemp("extracted")
+    with zipfile.ZipFile(DEMO_ZIP) as archive:
+        for info in archive.infolist():
+            if info.filename.endswith(".csv"):
+                (extracted_dir / Path(info.filename).name).write_bytes(archive.read(info))
+    return extracted_dir
 
 def test_pack_scores():
     metadata_scores_dict = {
@@ -21,18 +66,227 @@ def test_pack_scores():
         "Audible.MembershipBillings.csv": 144,
         "PrimeVideo.ViewingHistory.csv": 24,
     }
-    metadata_scores = [value for value in metadata_scores_dict.values()]
-    validation_scores = [value for value in validation_scores_dict.values()]
-    packed_str = pack_scores(metadata_scores, validation_scores)
-    unpacked_metadata_scores, unpacked_validation_scores = unpack_scores(packed_str)
+    metadata_scores = list(metadata_scores_dict.values())
+    validation_scores = list(validation_scores_dict.values())
+    packed_bytes = pack_scores_to_bytes(metadata_scores, validation_scores)
+    unpacked_metadata_scores, unpacked_validation_scores = unpack_scores_from_bytes(packed_bytes)
     print(f"metadata_scores: {metadata_scores}")
     print(f"validation_scores: {validation_scores}")
-    print(f"packed_str: {packed_str}")
+    print(f"packed_bytes: {packed_bytes.hex()}")
     print(f"unpacked metadata_scores: {unpacked_metadata_scores}")
     print(f"unpacked validation_scores: {unpacked_validation_scores}")
     assert metadata_scores == unpacked_metadata_scores
     assert validation_scores == unpacked_validation_scores
     print("Test passed")
-    
+
+def test_quantize_scores():
+    assert quantize_scores([0.0, 0.5, 1.0]) == [0, 127, 255]
+    assert quantize_scores([]) == []
+
+@pytest.mark.parametrize("bad_score", [float("nan"), float("inf"), -0.01, 1.01])
+def test_quantize_scores_rejects_invalid(bad_score):
+    with pytest.raises(ValueError):
+        quantize_scores([0.5, bad_score])
+
+def test_post_process_scores_is_version_tagged():
+    scores = {"Retail.CartItems.1.csv": (0.5, 0.6), "Audible.Library.csv": (1.0, 0.0)}
+    encoded = post_process_scores(scores)
+    assert encoded.startswith("v2:")
+    decoded = post_process_decode(encoded)
+    assert decoded.keys() == scores.keys()
+    for file_name, (metadata_score, validation_score) in scores.items():
+        assert abs(decoded[file_name][0] - metadata_score) < 1 / 255
+        assert abs(decoded[file_name][1] - validation_score) < 1 / 255
+
+def test_post_process_decode_reads_legacy_hex():
+    # Untagged payloads written before the format version: two hex digits per uint8 score
+    metadata_scores = [127, 0, 0, 0, 0, 255, 0, 0]
+    validation_scores = [153, 0, 0, 0, 0, 0, 0, 0]
+    legacy = "".join(f"{score:02x}" for score in metadata_scores + validation_scores)
+    decoded = post_process_decode(legacy)
+    assert decoded == {
+        INTERESTING_FILES[0]: (127 / 255, 153 / 255),
+        INTERESTING_FILES[5]: (1.0, 0.0),
+    }
+
+def test_process_pool_matches_thread_pool(demo_csv_dir, monkeypatch):
+    csv_files = sorted(find_csv_files(str(demo_csv_dir)))
+    assert len(csv_files) > 1
+    config = {"network": "mainnet", "input_extracted_dir": str(demo_csv_dir)}
+
+    with make_file_executor(csv_files) as executor:
+        assert isinstance(executor, ThreadPoolExecutor)
+        thread_results = list(executor.map(process_single_file, csv_files, [config] * len(csv_files)))
+
+    # Drop the size threshold so the demo files take the spawn process pool
+    monkeypatch.setattr(quality, "PROCESS_POOL_MIN_BYTES", 0)
+    with make_file_executor(csv_files) as executor:
+        assert isinstance(executor, ProcessPoolExecutor)
+        process_results = list(executor.map(process_single_file, csv_files, [config] * len(csv_files)))
+
+    assert process_results == thread_results
+
+def random_cart_metadata(rng, now):
+    """Cart item metadata as analyze_cart_items_data emits it, with some undated and empty records."""
+    num_items = rng.choice([0, rng.randint(1, 300)])
+    roll = rng.random()
+    if roll < 0.1:
+        date_range = {'earliest': None, 'latest': None}
+    else:
+        latest = now - timedelta(days=rng.randint(-5, 2000), seconds=rng.randint(0, 86399))
+        earliest = latest - timedelta(days=rng.randint(0, 800), seconds=rng.randint(0, 86399))
+        date_range = {'earliest': None if roll < 0.15 else earliest.isoformat(), 'latest': latest.isoformat()}
+    return {
+        'num_items': num_items,
+        'unique_products': rng.randint(0, num_items),
+        'date_range': date_range,
+        'cart_lists': {'active': rng.randint(0, num_items)},
+    }
+
+@pytest.mark.parametrize("network", ["mainnet", "satori"])
+def test_calculate_log_scores_matches_scalar(network):
+    validation_config = get_validation_config({"network": network})
+    values = np.array([0.0, -3.0, 0.5, 1.0, 4.0, 9.99, 10.0, 55.0, 1e6])
+    min_values = np.array([1.0, 3.0, 30.0])
+
+    # One minimum per row of a stack of columns, as the batch scorers broadcast it
+    scores = calculate_log_scores(np.tile(values, (len(min_values), 1)), min_values[:, np.newaxis], validation_config)
+    expected = [[calculate_log_score(value, min_value, validation_config) for value in values] for min_value in min_values]
+    np.testing.assert_allclose(scores, expected, rtol=1e-15, atol=0)
+
+    # Missing values score 0 like non-positive ones; empty input gives empty output
+    np.testing.assert_array_equal(calculate_log_scores(np.array([np.nan, 5.0]), 0.0, validation_config), [0.0, 0.0])
+    np.testing.assert_array_equal(calculate_log_scores(np.array([np.nan]), 2.0, validation_config), [0.0])
+    assert calculate_log_scores(np.array([]), 2.0, validation_config).shape == (0,)
+
+def test_date_range_days_batch_matches_scalar():
+    now = datetime.now()
+    rng = random.Random(7)
+    metadata = [random_cart_metadata(rng, now) for _ in range(300)]
+    earliest = [meta['date_range']['earliest'] for meta in metadata]
+    latest = [meta['date_range']['latest'] for meta in metadata]
+
+    date_range_days = calculate_date_range_days_batch(earliest, latest)
+    age_in_days = calculate_age_in_days_batch(latest, now)
+    for meta, days, age in zip(metadata, date_range_days, age_in_days):
+        date_range = meta['date_range']
+        if date_range['earliest'] and date_range['latest']:
+            assert days == (datetime.fromisoformat(date_range['latest']) - datetime.fromisoformat(date_range['earliest'])).days
+        else:
+            assert np.isnan(days)
+        if date_range['latest']:
+            assert age == (now - datetime.fromisoformat(date_range['latest'])).days
+        else:
+            assert np.isnan(age)
+
+    assert calculate_date_range_days_batch([], []).shape == (0,)
+    assert calculate_age_in_days_batch([], now).shape == (0,)
+
+@pytest.mark.parametrize("network", ["mainnet", "satori"])
+def test_cart_items_scores_batch_matches_scalar(network):
+    validation_config = get_validation_config({"network": network})
+    now = datetime.now()
+    rng = random.Random(11)
+    metadata = [random_cart_metadata(rng, now) for _ in range(500)]
+    earliest = [meta['date_range']['earliest'] for meta in metadata]
+    latest = [meta['date_range']['latest'] for meta in metadata]
+
+    batch = calculate_cart_items_scores_batch({
+        'num_items': np.array([meta['num_items'] for meta in metadata]),
+        'unique_products': np.array([meta['unique_products'] for meta in metadata]),
+        'date_range_days': calculate_date_range_days_batch(earliest, latest),
+        'active_items': np.array([meta['cart_lists']['active'] for meta in metadata]),
+        'age_in_days': calculate_age_in_days_batch(latest, now),
+    }, validation_config)
+    expected = [calculate_cart_items_score(meta, validation_config) for meta in metadata]
+
+    np.testing.assert_allclose(batch['score'], [result['score'] for result in expected], rtol=1e-12, atol=1e-15)
+    np.testing.assert_array_equal(batch['is_valid'], [result['is_valid'] for result in expected])
+
+def test_cart_items_scores_batch_empty():
+    validation_config = get_validation_config({"network": "mainnet"})
+    empty = np.array([])
+    batch = calculate_cart_items_scores_batch({
+        'num_items': empty, 'unique_products': empty, 'date_range_days': empty, 'active_items': empty, 'age_in_days': empty,
+    }, validation_config)
+    assert batch['score'].shape == batch['is_valid'].shape == (0,)
+
+def test_retail_order_history_score_without_precomputed_counts():
+    validation_config = get_validation_config({"network": "mainnet"})
+    latest = datetime.now() - timedelta(days=30)
+    metadata = {
+        'num_orders': 2000,
+        'total_amount': 50000.0,
+        'unique_products': 1500,
+        'date_range': {'earliest': (latest - timedelta(days=6 * 365)).isoformat(), 'latest': latest.isoformat()},
+        'websites': {'Amazon.com': 1900, 'Amazon.ca': 100},
+        'num_websites': 2,
+        'payment_methods': {'Visa': 1500, 'Gift Card': 400, 'Mastercard': 100},
+        'num_payment_methods': 3,
+        'order_statuses': {'Closed': 1950},
+        'gift_orders_percentage': 5.0,
+    }
+    expected = calculate_retail_order_history_score(metadata, validation_config)
+    assert expected['score'] > 0
+
+    # Metadata built without the precomputed counts falls back to the tallies
+    legacy_metadata = {key: value for key, value in metadata.items() if key not in ('num_websites', 'num_payment_methods')}
+    assert calculate_retail_order_history_score(legacy_metadata, validation_config) == expected
+
+@pytest.mark.parametrize("date_string, expected", [
+    ("2024-01-05T10:00:00Z", datetime(2024, 1, 5, 10)),
+    ("2024-01-05 10:00:00", datetime(2024, 1, 5, 10)),
+    ("2024-01-05T10:00:00.123Z", datetime(2024, 1, 5, 10, 0, 0, 123000)),
+    ("2024-01-05 10:00:00.5", datetime(2024, 1, 5, 10, 0, 0, 500000)),
+    ("2024-01-05", datetime(2024, 1, 5)),
+    ("2024-1-5", datetime(2024, 1, 5)),
+])
+def test_parse_date(date_string, expected):
+    assert parse_date(date_string) == expected
+
+@pytest.mark.parametrize("date_string", [
+    "2024-01-05T10:00:00",
+    "2024-01-05Z",
+    "20240105",
+    "2024-W01-1",
+    "2024-01-05 10:00",
+    "2024-01-05T10:00:00+00:00",
+    "2024-01-05T10:00:00.123",
+])
+def test_parse_date_rejects_other_iso_formats(date_string):
+    # fromisoformat accepts these, but none of DATE_FORMATS does
+    with pytest.raises(ValueError, match="not in a recognized format"):
+        parse_date(date_string)
+
+def test_retail_order_history_purchases_per_week_on_the_minimum():
+    validation_config = get_validation_config({"network": "mainnet"})
+    latest = datetime.now() - timedelta(days=30)
+    # 1176 orders over 2744 days is exactly 3 per week
+    metadata = {
+        'num_orders': 1176,
+        'total_amount': 50000.0,
+        'unique_products': 1000,
+        'date_range': {'earliest': (latest - timedelta(days=2744)).isoformat(), 'latest': latest.isoformat()},
+        'websites': {'Amazon.com': 1176},
+        'payment_methods': {'Visa': 1176},
+        'order_statuses': {'Closed': 1176},
+        'gift_orders_percentage': 0.0,
+    }
+    result = calculate_retail_order_history_score(metadata, validation_config)
+    assert result['score'] > 0, result['reasons']
+
+@pytest.mark.parametrize("content", [
+    b'\xef\xbb\xbfa,b\r\n1,2\r\n"x\r\ny",4\r\n',
+    b'a,b\n1,2\n\n3,4,5\n6\n',
+    b'a,b\n',
+    b'',
+])
+def test_read_csv_rows_matches_dict_reader(tmp_path, content):
+    csv_file = tmp_path / "Retail.CartItems.1.csv"
+    csv_file.write_bytes(content)
+    with open(csv_file, 'r', encoding='utf-8-sig') as file:
+        expected = list(csv.DictReader(file))
+    assert read_csv_rows(csv_file) == expected
+
 if __name__ == "__main__":
     test_pack_scores()
\ No newline at end of file
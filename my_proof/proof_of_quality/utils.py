@@ -15,11 +15,13 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from typing import Dict
+import math
+import re
 import numpy as np
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
-from .config import get_validation_config
+from datetime import datetime
+from functools import lru_cache
+from .config import get_validation_config, ValidationConfig
 
 def parse_float(value):
     if isinstance(value, str):
@@ -29,42 +31,66 @@ def parse_float(value):
     except ValueError:
         return 0.0
 
+# Formats accepted by parse_date, most common in the exports first
+DATE_FORMATS = ('%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d')
+
+# The exact shapes of DATE_FORMATS with zero-padded fields. fromisoformat also accepts
+# offsets, basic and week dates and 'T'-separated times without 'Z', which parse_date rejects.
+_DATE_FORMATS_SHAPE = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+    r'(?:T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?Z| [0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?)?'
+)
+
+# Timestamps recur across files and proofs; datetimes are immutable, so sharing them is safe
+@lru_cache(maxsize=1 << 16)
 def parse_date(date_string):
-    date_formats = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%d %H:%M:%S']
-    for fmt in date_formats:
+    # fromisoformat parses these shapes in C without raising per failed format;
+    # anything else, such as unpadded fields, is left to strptime
+    if _DATE_FORMATS_SHAPE.fullmatch(date_string):
+        try:
+            return datetime.fromisoformat(date_string[:-1] if date_string.endswith('Z') else date_string)
+        except ValueError:
+            pass
+
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_string, fmt)
         except ValueError:
             continue
     raise ValueError(f"Date '{date_string}' is not in a recognized format.")
 
-def calculate_time_weight(date_range: dict) -> tuple:
+# Use 4 years as max age for the time weight
+MAX_AGE_DAYS = 365 * 4
+# Scalar logs use math rather than NumPy ufuncs, which cost more to dispatch than to compute
+_LOG1P_MAX_AGE_YEARS = math.log1p(MAX_AGE_DAYS / 365)
+_LOG1P_10 = math.log1p(10)
+
+def time_weight_from_age(age_in_days: int) -> float:
     """
     Calculate time weight using natural logarithm that tapers off at max_age.
     Weight = 1 - ln(1 + age/365) / ln(1 + max_age/365)
     """
-    if date_range['latest']:
-        latest_date = datetime.fromisoformat(date_range['latest'])
-    else:
-        return 0.0, 0
-
-    current_date = datetime.now()
-    age_in_days = (current_date - latest_date).days
-
     if age_in_days < 0:
-        return 0.0, age_in_days
+        return 0.0
 
-    # Use 4 years as max age
-    max_age_days = 365 * 4
-    
     # Natural log scaling relative to years
     # This creates a smooth curve that reaches 0 at max_age
-    weight = 1 - (np.log1p(age_in_days/365) / np.log1p(max_age_days/365))
+    weight = 1 - (math.log1p(age_in_days/365) / _LOG1P_MAX_AGE_YEARS)
     
     # Ensure weight is between 0 and 1
-    weight = max(0.0, min(1.0, weight))
+    return max(0.0, min(1.0, weight))
 
-    return weight, age_in_days
+def calculate_time_weight_vec(age_days: np.ndarray) -> np.ndarray:
+    """
+    Array version of time_weight_from_age.
+    Future or missing (NaN) ages get no weight.
+    """
+    age_days = np.asarray(age_days, dtype=np.float64)
+
+    has_age = age_days >= 0
+    weights = 1 - (np.log1p(np.where(has_age, age_days, 0.0) / 365) / _LOG1P_MAX_AGE_YEARS)
+
+    return np.where(has_age, np.clip(weights, 0.0, 1.0), 0.0)
 
 def plot_decay_comparison(half_life_days=365):
     """
@@ -73,7 +99,7 @@ def plot_decay_comparison(half_life_days=365):
     age_days = np.linspace(0, 365 * 4, 1000)  # Show 4 years
     
     # Calculate weights
-    weights = [calculate_time_weight({'latest': (datetime.now() - timedelta(days=d)).isoformat()})[0] for d in age_days]
+    weights = calculate_time_weight_vec(age_days)
     
     plt.figure(figsize=(12, 6))
     plt.plot(age_days, weights, 'b-', linewidth=2, label='Time Weight')
@@ -92,7 +118,7 @@ def plot_decay_comparison(half_life_days=365):
     plt.ylim(-0.05, 1.05)
     plt.savefig('time_decay_comparison.png')
 
-def calculate_log_score(value: float, min_value: float, validation_config: Dict[str, any]) -> float:
+def calculate_log_score(value: float, min_value: float, validation_config: ValidationConfig) -> float:
     """
     Calculate a pure logarithmic score.
     score = ln(min(1, value/min_value))
@@ -100,13 +126,17 @@ def calculate_log_score(value: float, min_value: float, validation_config: Dict[
     if value <= 0 or min_value <= 0:
         return 0.0
     
-    score_scaling = validation_config.get("SCORE_SCALING", 1.5)
+    score_scaling = validation_config.SCORE_SCALING
     
     # Calculate ratio
     ratio = value / min_value
+
+    # From 10x the minimum the unscaled score is already 1, so a scaling of 1 or more caps it
+    if ratio >= 10 and score_scaling >= 1:
+        return 1.0
     
     # Pure logarithmic scoring
-    log_score = np.log1p(ratio) / np.log1p(10)  # normalize to log(11) for 0-1 range
+    log_score = math.log1p(ratio) / _LOG1P_10  # normalize to log(11) for 0-1 range
     
     # Apply scaling
     log_score *= score_scaling
@@ -114,20 +144,21 @@ def calculate_log_score(value: float, min_value: float, validation_config: Dict[
     # Ensure score is between 0 and 1
     return max(0.0, min(1.0, log_score))
 
-def visualize_log_score_behavior(validation_config: Dict[str, any]):
+def visualize_log_score_behavior(validation_config: ValidationConfig):
     """
     Visualize how calculate_log_score behaves with different inputs.
     Shows the effect of ratio and scaling on final scores.
     """
     import matplotlib.pyplot as plt
     import numpy as np
+    from .score_calculators_batch import calculate_log_scores
 
     # Test ranges
     min_value = 1.0
     values = np.linspace(0, 10 * min_value, 1000)  # Test up to 10x minimum
     
     # Calculate scores
-    scores = [calculate_log_score(v, min_value, validation_config) for v in values]
+    scores = calculate_log_scores(values, min_value, validation_config)
     ratios = values / min_value
 
     # Create figure with multiple subplots
@@ -161,7 +192,7 @@ def visualize_log_score_behavior(validation_config: Dict[str, any]):
         score = calculate_log_score(ratio * min_value, min_value, validation_config)
         print(f"Ratio: {ratio:4.1f}x minimum -> Score: {score:.3f}")
 
-def analyze_scoring_behavior(validation_config: Dict[str, any]):
+def analyze_scoring_behavior(validation_config: ValidationConfig):
     """
     Comprehensive analysis of the scoring system behavior.
     Shows multiple visualizations and analyses of how scores change with different inputs.
@@ -169,7 +200,11 @@ def analyze_scoring_behavior(validation_config: Dict[str, any]):
     import matplotlib.pyplot as plt
     import numpy as np
     from matplotlib.gridspec import GridSpec
-    from datetime import datetime, timedelta
+    from .score_calculators_batch import calculate_log_scores
+
+    # Every panel and printout below samples these ages; weigh each of them once
+    ages = [0, 30, 90, 180, 365]
+    weights_by_age = dict(zip(ages, calculate_time_weight_vec(ages)))
 
     # Create figure with multiple subplots
     plt.style.use('default')
@@ -179,7 +214,7 @@ def analyze_scoring_behavior(validation_config: Dict[str, any]):
     # 1. Basic Score vs Ratio relationship
     ax1 = fig.add_subplot(gs[0, 0])
     ratios = np.linspace(0, 10, 1000)
-    scores = [calculate_log_score(r, 1.0, validation_config) for r in ratios]
+    scores = calculate_log_scores(ratios, 1.0, validation_config)
     ax1.plot(ratios, scores, 'b-', label='Score')
     ax1.axvline(x=1, color='r', linestyle='--', label='Minimum')
     ax1.axhline(y=0.5, color='g', linestyle='--', label='Mid Score')
@@ -206,7 +241,7 @@ def analyze_scoring_behavior(validation_config: Dict[str, any]):
     # 3. Time Weight Effect
     ax3 = fig.add_subplot(gs[1, 0])
     days = np.linspace(0, 365*2, 1000)
-    weights = [calculate_time_weight({'latest': (datetime.now() - timedelta(days=d)).isoformat()})[0] for d in days]
+    weights = calculate_time_weight_vec(days)
     ax3.plot(days, weights, 'g-', label='Time Weight')
     ax3.axvline(x=365, color='r', linestyle='--', label='1 Year')
     ax3.grid(True, alpha=0.3)
@@ -218,10 +253,9 @@ def analyze_scoring_behavior(validation_config: Dict[str, any]):
     # 4. Combined Effects
     ax4 = fig.add_subplot(gs[1, 1])
     ratios = np.linspace(0, 10, 100)
-    ages = [0, 30, 90, 180, 365]
+    log_scores = calculate_log_scores(ratios, 1.0, validation_config)
     for age in ages:
-        time_weight = calculate_time_weight({'latest': (datetime.now() - timedelta(days=age)).isoformat()})[0]
-        scores = [calculate_log_score(r, 1.0, validation_config) * time_weight for r in ratios]
+        scores = log_scores * weights_by_age[age]
         ax4.plot(ratios, scores, label=f'{age} days old')
     ax4.grid(True, alpha=0.3)
     ax4.set_xlabel('Ratio (value/minimum)')
@@ -239,13 +273,12 @@ def analyze_scoring_behavior(validation_config: Dict[str, any]):
         (5.0, '5x Minimum'),
         (10.0, '10x Minimum')
     ]
-    ages = [0, 30, 90, 180, 365]
     data = []
     labels = []
     for ratio, label in test_cases:
+        log_score = calculate_log_score(ratio, 1.0, validation_config)
         for age in ages:
-            time_weight = calculate_time_weight({'latest': (datetime.now() - timedelta(days=age)).isoformat()})[0]
-            score = calculate_log_score(ratio, 1.0, validation_config) * time_weight
+            score = log_score * weights_by_age[age]
             data.append(score)
             labels.append(f'{label}\n{age} days')
     
@@ -264,22 +297,22 @@ def analyze_scoring_behavior(validation_config: Dict[str, any]):
         print(f"Ratio {ratio:4.1f}x minimum -> Score: {score:.3f}")
 
     print("\n2. Time Weight Effects:")
-    for days in [0, 30, 90, 180, 365]:
-        weight = calculate_time_weight({'latest': (datetime.now() - timedelta(days=days)).isoformat()})[0]
+    for days in ages:
+        weight = weights_by_age[days]
         print(f"Age {days:3d} days -> Weight: {weight:.3f}")
 
     print("\n3. Combined Effects:")
     for ratio in [1.0, 2.0, 5.0]:
+        log_score = calculate_log_score(ratio, 1.0, validation_config)
         for days in [0, 90, 365]:
-            time_weight = calculate_time_weight({'latest': (datetime.now() - timedelta(days=days)).isoformat()})[0]
-            score = calculate_log_score(ratio, 1.0, validation_config) * time_weight
+            score = log_score * weights_by_age[days]
             print(f"Ratio {ratio:4.1f}x, Age {days:3d} days -> Final Score: {score:.3f}")
 
     plt.tight_layout()
     plt.savefig('scoring_analysis.png')
 
 # Add to existing visualization functions
-def plot_all_analyses(validation_config: Dict[str, any]):
+def plot_all_analyses(validation_config: ValidationConfig):
     """Run all visualization and analysis functions."""
     print("=== Log Score Behavior ===")
     visualize_log_score_behavior(validation_config)
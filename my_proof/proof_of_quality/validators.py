@@ -18,51 +18,48 @@
 import json
 import random
 import logging
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Optional
 from openai import OpenAI
-from .config import get_validation_config, DATA_TYPE_MAP
+from .config import get_validation_config, DATA_TYPE_MAP, ValidationConfig
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def validate_sample(data: list, filename: str, openai_api_key: str, validation_config: Dict[str, any]) -> dict:
-    client = OpenAI(api_key=openai_api_key)
+# Upper bound on chat completions in flight for one sample, to stay within API rate limits
+MAX_CONCURRENT_REQUESTS = 10
 
-    sample_size = validation_config["SAMPLE_SIZE"]
-    threshold_score = validation_config["THRESHOLD_SCORE"]
 
-    sample = random.sample(data, min(sample_size, len(data)))
-    scores = []
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Process-wide client per API key, so every file's validation reuses one connection pool."""
+    return OpenAI(api_key=api_key)
 
-    data_type = DATA_TYPE_MAP.get(filename, "Amazon data")
 
+def validate_sample(data: list, filename: str, openai_api_key: str, validation_config: ValidationConfig) -> dict:
+    client = get_openai_client(openai_api_key)
+
+    sample_size = validation_config.SAMPLE_SIZE
+    threshold_score = validation_config.THRESHOLD_SCORE
+
+    # Sampling indices picks the same rows as sampling data itself, without copying the row list
+    sample = [data[i] for i in random.sample(range(len(data)), min(sample_size, len(data)))]
+
+    data_type = DATA_TYPE_MAP.get(filename, "Amazon data")
     system_message = create_system_message(data_type)
+    score_order = partial(_score_order, client, validation_config.GPT_MODEL, system_message)
 
-    for order in sample:
-        order_text = "\n".join([f"{key}: {value}" for key, value in order.items()])
-
-        response = client.chat.completions.create(
-            model=validation_config["GPT_MODEL"],
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": f"# Data to evaluate:\n\n{order_text}"}
-            ],
-        )
-
-        score_json = response.choices[0].message.content.strip()
-        logger.info(f"LLM validation response: {score_json}")
-
-        try:
-            score_data = json.loads(score_json)
-            score = int(score_data["score"]) / 100.0
-            scores.append(score)
-        except (json.JSONDecodeError, KeyError, ValueError):
-            logger.error("Failed to get a valid JSON response.")
-            return {
-                'is_valid': False,
-                'score': 0.0
-            }
+    # Each call mostly waits on the API, so the whole sample is scored concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_REQUESTS, len(sample)))) as executor:
+        scores = list(executor.map(score_order, sample))
+
+    if None in scores:
+        return {
+            'is_valid': False,
+            'score': 0.0
+        }
 
     avg_score = sum(scores) / len(scores)
     logger.info(f"Average LLM validation score: {avg_score}")
@@ -72,6 +69,33 @@ def validate_sample(data: list, filename: str, openai_api_key: str, validation_c
         'score': avg_score
     }
 
+def _score_order(client: OpenAI, model: str, system_message: str, order: dict) -> Optional[float]:
+    """Ask the LLM to score one order; returns the score on a 0-1 scale, or None for an unusable response."""
+    # str.join materializes any iterable as a list first, so a generator here would only add overhead
+    order_text = "\n".join([f"{key}: {value}" for key, value in order.items()])
+
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": f"# Data to evaluate:\n\n{order_text}"}
+        ],
+        # JSON mode makes the API return a parseable object rather than free text
+        response_format={"type": "json_object"},
+    )
+
+    score_json = response.choices[0].message.content.strip()
+    logger.info(f"LLM validation response: {score_json}")
+
+    try:
+        score_data = json.loads(score_json)
+        return int(score_data["score"]) / 100.0
+    except (json.JSONDecodeError, KeyError, ValueError):
+        logger.error("Failed to get a valid JSON response.")
+        return None
+
+# One prompt per data type, built on first use
+@lru_cache(maxsize=16)
 def create_system_message(data_type: str) -> str:
     return (
         f"You are an AI language model assigned to evaluate the following Amazon {data_type} for consistency, validity, data quality, and authenticity (likelihood of being genuine and not fabricated). Carefully analyze the data, considering factors such as:\n\n"
@@ -15,14 +15,57 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import atexit
 import logging
-from typing import Dict, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from operator import itemgetter
+from typing import Dict, Any, List
+from datasketch import MinHash
 from my_proof.proof_of_uniqueness.api_client import ProofOfUniquenessClient
 from my_proof.proof_of_uniqueness.data_processor import DataProcessor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Saving an accepted MinHash does not change the score, so it overlaps with the rest of the proof;
+# Proof.generate waits for it before returning so a failed save still fails the proof
+_save_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="minhash-save")
+_pending_saves: List[Future] = []
+_pending_saves_lock = threading.Lock()
+
+
+def _save_minhash_in_background(client: ProofOfUniquenessClient, user_id: str, minhash: MinHash) -> None:
+    future = _save_executor.submit(client.save_minhash, user_id, minhash)
+    future.add_done_callback(_log_saved_minhash)
+    with _pending_saves_lock:
+        _pending_saves.append(future)
+
+
+def _log_saved_minhash(future: Future) -> None:
+    try:
+        entry_id = future.result()
+    except Exception as e:
+        logger.error(f"Failed to save MinHash: {e}")
+    else:
+        logger.info(f"Saved MinHash entry {entry_id}")
+
+
+def wait_for_pending_saves() -> None:
+    """
+    Block until every background MinHash save has finished.
+    Re-raises the first failed save: a unique score only holds once its MinHash is stored.
+    """
+    with _pending_saves_lock:
+        pending = _pending_saves[:]
+        _pending_saves.clear()
+    wait(pending)
+    for future in pending:
+        future.result()
+
+
+atexit.register(wait_for_pending_saves)
+
 
 def proof_of_uniqueness(config: Dict[str, Any]) -> int:
     """
@@ -42,16 +85,16 @@ def proof_of_uniqueness(config: Dict[str, Any]) -> int:
         return 0
 
     # Query the server for similar MinHashes
-    similar_entries = client.query_similar_minhashes(minhash, num_perm=config['num_perm'])
+    similar_entries = client.query_similar_minhashes(minhash)
     logger.info(f"Found {len(similar_entries)} candidate entries from LSH")
 
     if not similar_entries:
-        client.save_minhash(user_id, minhash)
+        _save_minhash_in_background(client, user_id, minhash)
         logger.info("No similar entries found. Saving as new entry.")
         return 1
 
     # Find the highest similarity with existing entries
-    max_similarity = max(entry["similarity"] for entry in similar_entries)
+    max_similarity = max(map(itemgetter("similarity"), similar_entries))
     logger.info(f"Highest similarity: {max_similarity:.4f}")
 
     # If similarity is above threshold, reject as duplicate
@@ -60,6 +103,6 @@ def proof_of_uniqueness(config: Dict[str, Any]) -> int:
         return 0
 
     # Data is sufficiently unique, save and accept
-    client.save_minhash(user_id, minhash)
+    _save_minhash_in_background(client, user_id, minhash)
     logger.info("Data passed uniqueness check. Saving new entry.")
     return 1
@@ -15,10 +15,11 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import requests
-from typing import List, Dict
+import warnings
+from typing import List, Dict, Optional
 from datasketch import MinHash
-from my_proof.proof_of_uniqueness.minhash_utils import serialize_minhash, deserialize_minhash
+from my_proof.utils import http_session, TEE_REQUEST_TIMEOUT
+from my_proof.proof_of_uniqueness.minhash_utils import serialize_minhash
 
 
 class ProofOfUniquenessClient:
@@ -31,20 +32,36 @@ class ProofOfUniquenessClient:
 
     def save_minhash(self, user_id: str, minhash: MinHash) -> int:
         minhash_data = serialize_minhash(minhash)
-        response = requests.post(
+        response = http_session.post(
             f"{self.base_url}/minhash",
             headers=self.headers,
-            json={"user_id": user_id, "minhash_data": minhash_data}
+            json={"user_id": user_id, "minhash_data": minhash_data},
+            timeout=TEE_REQUEST_TIMEOUT
         )
         response.raise_for_status()
         return response.json()["id"]
 
-    def query_similar_minhashes(self, minhash: MinHash, num_perm: int) -> List[Dict]:
+    def query_similar_minhashes(self, minhash: MinHash, num_perm: Optional[int] = None) -> List[Dict]:
+        """
+        Find stored MinHashes similar to minhash.
+        Each candidate keeps its MinHash serialized as minhash_data instead of a decoded minhash;
+        minhash_utils.deserialize_minhash decodes it when more than the similarity is needed.
+
+        num_perm is deprecated and ignored; it was only needed to decode the candidates.
+        """
+        if num_perm is not None:
+            warnings.warn(
+                "query_similar_minhashes no longer uses num_perm; stop passing it",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         minhash_data = serialize_minhash(minhash)
-        response = requests.post(
+        response = http_session.post(
             f"{self.base_url}/minhash/query",
             headers=self.headers,
-            json={"user_id": "", "minhash_data": minhash_data}
+            json={"user_id": "", "minhash_data": minhash_data},
+            timeout=TEE_REQUEST_TIMEOUT
         )
         response.raise_for_status()
         candidates = response.json()["candidates"]
@@ -52,8 +69,9 @@ class ProofOfUniquenessClient:
             {
                 "id": entry["id"],
                 "user_id": entry["user_id"],
-                "minhash": deserialize_minhash(entry["minhash"], num_perm=num_perm),
+                "minhash_data": entry["minhash"],
                 "similarity": entry["similarity"]
             }
             for entry in candidates
         ]
+
@@ -17,11 +17,22 @@
 
 import csv
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Collection
 from datasketch import MinHash
 
+# Order-specific fields that would make otherwise identical histories look unique
+FIELDS_TO_REMOVE = frozenset({'Order Date', 'Ship Date', 'Order ID'})
+
 
 class DataProcessor:
+    # Columns read by extract_features; everything else is skipped while parsing
+    FEATURE_COLUMNS = frozenset({
+        'Product Name', 'Title',
+        'Total Owed', 'Total Amount',
+        'Quantity', 'Units',
+        'Category', 'Product Group',
+    })
+
     @staticmethod
     def process_order_history(unzipped_data_dir: str, num_perm: int) -> MinHash:
         csv_files = DataProcessor.gather_csv_files(unzipped_data_dir)
@@ -30,7 +41,7 @@ class DataProcessor:
 
         minhash = MinHash(num_perm=num_perm)
         for csv_file in csv_files:
-            data = DataProcessor.read_and_normalize_csv(csv_file)
+            data = DataProcessor.read_and_normalize_csv(csv_file, columns=DataProcessor.FEATURE_COLUMNS)
             features = DataProcessor.extract_features(data)
             DataProcessor.update_minhash(minhash, features)
 
@@ -41,23 +52,32 @@ class DataProcessor:
         return list(Path(unzipped_data_dir).rglob("*.csv"))
 
     @staticmethod
-    def read_and_normalize_csv(csv_file: Path) -> List[Dict[str, Any]]:
+    def read_and_normalize_csv(csv_file: Path, columns: Optional[Collection[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream normalized rows from a CSV file, dropping order-specific fields.
+        If columns is given, only those columns are normalized and returned.
+        """
+        # Text mode (no newline='') translates CRLF inside quoted fields to \n, as the MinHashes stored in the TEE expect
         with open(csv_file, 'r', encoding='utf-8-sig') as file:
-            csv_reader = csv.DictReader(file)
-            data = list(csv_reader)
-        
-        normalized_data = []
-        for row in data:
-            row = {k: v.strip().lower() if isinstance(v, str) else v for k, v in row.items()}
-            fields_to_remove = ['Order Date', 'Ship Date', 'Order ID']
-            for field in fields_to_remove:
-                row.pop(field, None)
-            normalized_data.append(row)
-        
-        return normalized_data
+            csv_reader = csv.reader(file)
+            header = next(csv_reader, None)
+            if header is None:
+                return
+
+            # Resolve the columns to keep once from the header rather than per row
+            selected = [
+                (i, name) for i, name in enumerate(header)
+                if name not in FIELDS_TO_REMOVE and (columns is None or name in columns)
+            ]
+
+            for row in csv_reader:
+                if not row:
+                    continue
+                num_values = len(row)
+                yield {name: row[i].strip().lower() for i, name in selected if i < num_values}
 
     @staticmethod
-    def extract_features(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def extract_features(data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         features = {
             'products': set(),
             'total_amount': 0.0,
@@ -84,15 +104,22 @@ class DataProcessor:
 
     @staticmethod
     def update_minhash(minhash: MinHash, features: Dict[str, Any]):
-        for product in features['products']:
-            minhash.update(product.encode('utf-8'))
-        for category in features['categories']:
-            minhash.update(category.encode('utf-8'))
-        minhash.update(f"amount:{features['total_amount']:.2f}".encode('utf-8'))
-        minhash.update(f"quantity:{features['total_quantity']}".encode('utf-8'))
+        # update_batch hashes every value in a single vectorized pass
+        values = [product.encode('utf-8') for product in features['products']]
+        values.extend(category.encode('utf-8') for category in features['categories'])
+        values.append(f"amount:{features['total_amount']:.2f}".encode('utf-8'))
+        values.append(f"quantity:{features['total_quantity']}".encode('utf-8'))
+        minhash.update_batch(values)
 
     @staticmethod
     def parse_float(value):
+        # Most rows either lack the column or hold a plain number; avoid raising for those
+        if not value:
+            return 0.0
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            pass
         if isinstance(value, str):
             value = value.strip().replace(',', '')
         try:
@@ -102,6 +129,12 @@ class DataProcessor:
 
     @staticmethod
     def parse_int(value):
+        if not value:
+            return 0
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            pass
         if isinstance(value, str):
             value = value.strip().replace(',', '')
         try:
@@ -1,20 +1,32 @@
+import copy
 import json
-import base64
+import binascii
+from functools import lru_cache
 import numpy as np
 from datasketch import MinHash
 
+# The hashvalues travel as base64 inside JSON because the TEE API stores and returns
+# minhash_data as that string; binascii encodes straight from the array's buffer.
+
+
+@lru_cache(maxsize=8)
+def _prototype_minhash(num_perm: int, seed: int) -> MinHash:
+    """Empty MinHash whose permutations are shared by every deserialized MinHash with these parameters."""
+    return MinHash(num_perm=num_perm, seed=seed)
 
 def serialize_minhash(minhash: MinHash) -> str:
     """Serialize a MinHash object to a JSON string."""
     minhash_dict = {
         'seed': minhash.seed,
-        'hashvalues': base64.b64encode(minhash.hashvalues.tobytes()).decode('ascii')
+        'hashvalues': binascii.b2a_base64(minhash.hashvalues, newline=False).decode('ascii')
     }
     return json.dumps(minhash_dict)
 
 def deserialize_minhash(json_str: str, num_perm: int) -> MinHash:
     """Deserialize a JSON string to a MinHash object."""
     minhash_dict = json.loads(json_str)
-    minhash = MinHash(num_perm=num_perm, seed=minhash_dict['seed'])
-    minhash.hashvalues = np.frombuffer(base64.b64decode(minhash_dict['hashvalues']), dtype=np.uint64)
+    # Copying a prototype skips regenerating the permutations, which only depend on num_perm and seed
+    prototype = _prototype_minhash(num_perm, minhash_dict['seed'])
+    minhash = copy.copy(prototype)
+    minhash.hashvalues = np.frombuffer(binascii.a2b_base64(minhash_dict['hashvalues']), dtype=prototype.hashvalues.dtype)
     return minhash
@@ -0,0 +1,130 @@
+import csv
+import importlib
+
+import numpy as np
+import pytest
+import requests
+from datasketch import MinHash
+
+my_proof = importlib.import_module("my_proof")
+uniqueness = importlib.import_module("my_proof.proof_of_uniqueness")
+api_client = importlib.import_module("my_proof.proof_of_uniqueness.api_client")
+DataProcessor = importlib.import_module("my_proof.proof_of_uniqueness.data_processor").DataProcessor
+
+CONFIG = {
+    "dlp_id": 1,
+    "tee_api_endpoint": "https://tee",
+    "prime_api_key": "key",
+    "input_extracted_dir": "unused",
+    "user_id": "user",
+    "num_perm": 128,
+    "uniqueness_threshold": 0.9,
+}
+
+
+class FakeClient:
+    """Stands in for ProofOfUniquenessClient; saving can be made to fail."""
+    candidates = []
+    save_error = None
+    saved = []
+
+    def __init__(self, base_url, api_key):
+        pass
+
+    def query_similar_minhashes(self, minhash):
+        return self.candidates
+
+    def save_minhash(self, user_id, minhash):
+        if self.save_error is not None:
+            raise self.save_error
+        self.saved.append(user_id)
+        return len(self.saved)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    minhash = MinHash(num_perm=CONFIG["num_perm"])
+    minhash.update(b"order")
+    monkeypatch.setattr(uniqueness.DataProcessor, "process_order_history", lambda input_dir, num_perm: minhash)
+    monkeypatch.setattr(uniqueness, "ProofOfUniquenessClient", FakeClient)
+    monkeypatch.setattr(FakeClient, "candidates", [])
+    monkeypatch.setattr(FakeClient, "save_error", None)
+    monkeypatch.setattr(FakeClient, "saved", [])
+    yield FakeClient
+    # Leave no failed save behind for the atexit hook
+    try:
+        uniqueness.wait_for_pending_saves()
+    except Exception:
+        pass
+
+
+def test_unique_data_is_saved(client):
+    assert uniqueness.proof_of_uniqueness(CONFIG) == 1
+    uniqueness.wait_for_pending_saves()
+    assert client.saved == ["user"]
+
+
+def test_duplicate_is_not_saved(client, monkeypatch):
+    monkeypatch.setattr(client, "candidates", [{"similarity": 0.2}, {"similarity": 0.95}])
+    assert uniqueness.proof_of_uniqueness(CONFIG) == 0
+    uniqueness.wait_for_pending_saves()
+    assert client.saved == []
+
+
+def test_wait_for_pending_saves_reraises_failed_save(client, monkeypatch):
+    monkeypatch.setattr(client, "save_error", requests.HTTPError("500 Server Error"))
+    assert uniqueness.proof_of_uniqueness(CONFIG) == 1
+    with pytest.raises(requests.HTTPError):
+        uniqueness.wait_for_pending_saves()
+    # The failure is reported once; later waits have nothing pending
+    uniqueness.wait_for_pending_saves()
+
+
+def test_failed_save_fails_proof_generation(client, monkeypatch):
+    monkeypatch.setattr(client, "save_error", requests.HTTPError("500 Server Error"))
+    monkeypatch.setattr(my_proof, "proof_of_authenticity", lambda config: 1)
+    monkeypatch.setattr(my_proof, "proof_of_quality", lambda config: ("", {}))
+
+    with pytest.raises(requests.HTTPError):
+        my_proof.Proof(CONFIG).generate()
+
+
+def test_multiline_quoted_field_keeps_text_mode_newlines(tmp_path):
+    (tmp_path / "Retail.OrderHistory.1.csv").write_bytes(
+        b'Order ID,Product Name,Total Owed,Quantity\r\n'
+        b'1,"Widget\r\nDeluxe",12.50,2\r\n'
+        b'2,Gadget,3.00,1\r\n'
+    )
+
+    rows = list(DataProcessor.read_and_normalize_csv(tmp_path / "Retail.OrderHistory.1.csv"))
+    assert rows == [
+        {"Product Name": "widget\ndeluxe", "Total Owed": "12.50", "Quantity": "2"},
+        {"Product Name": "gadget", "Total Owed": "3.00", "Quantity": "1"},
+    ]
+
+    # The stored MinHashes were built from rows read in text mode with DictReader
+    with open(tmp_path / "Retail.OrderHistory.1.csv", "r", encoding="utf-8-sig") as file:
+        reference_rows = [{k: v.strip().lower() for k, v in row.items()} for row in csv.DictReader(file)]
+    expected = MinHash(num_perm=CONFIG["num_perm"])
+    DataProcessor.update_minhash(expected, DataProcessor.extract_features(reference_rows))
+
+    minhash = DataProcessor.process_order_history(str(tmp_path), num_perm=CONFIG["num_perm"])
+    np.testing.assert_array_equal(minhash.hashvalues, expected.hashvalues)
+
+
+def test_query_similar_minhashes_keeps_candidates_serialized(monkeypatch):
+    class Response:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"candidates": [{"id": 7, "user_id": "other", "minhash": "serialized", "similarity": 0.4}]}
+
+    monkeypatch.setattr(api_client.http_session, "post", lambda url, headers, json, timeout: Response())
+    client = api_client.ProofOfUniquenessClient(base_url="https://tee", api_key="key")
+    minhash = MinHash(num_perm=CONFIG["num_perm"])
+    expected = [{"id": 7, "user_id": "other", "minhash_data": "serialized", "similarity": 0.4}]
+
+    assert client.query_similar_minhashes(minhash) == expected
+    with pytest.warns(DeprecationWarning):
+        assert client.query_similar_minhashes(minhash, num_perm=CONFIG["num_perm"]) == expected
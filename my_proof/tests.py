@@ -0,0 +1,42 @@
+import importlib
+
+utils = importlib.import_module("my_proof.utils")
+
+CONFIG = {
+    "remote_log_enabled": True,
+    "tee_api_endpoint": "https://tee",
+    "prime_api_key": "key",
+    "proof_key": "proof-1",
+}
+
+
+def test_remote_log_posts_content(monkeypatch):
+    sent = []
+
+    def fake_post(url, headers, json, timeout):
+        sent.append((url, headers, json, timeout))
+
+    monkeypatch.setattr(utils.http_session, "post", fake_post)
+    utils.remote_log(CONFIG, "line")
+
+    assert sent == [(
+        "https://tee/log",
+        {"X-API-Key": "key"},
+        {"proof_key": "proof-1", "log_content": "line"},
+        utils.TEE_REQUEST_TIMEOUT,
+    )]
+
+
+def test_remote_log_disabled_sends_nothing(monkeypatch):
+    sent = []
+    monkeypatch.setattr(utils.http_session, "post", lambda *args, **kwargs: sent.append(args))
+    utils.remote_log({"remote_log_enabled": False}, "line")
+    assert sent == []
+
+
+def test_remote_log_failure_does_not_raise(monkeypatch):
+    def fake_post(url, headers, json, timeout):
+        raise ConnectionError("endpoint down")
+
+    monkeypatch.setattr(utils.http_session, "post", fake_post)
+    utils.remote_log(CONFIG, "line")
@@ -1,18 +1,37 @@
+import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
+from urllib3.util.retry import Retry
+
+TEE_REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
+# Process-lifetime session shared by all TEE API calls so TLS connections are reused
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
+
 
 def remote_log(config: Dict[str, Any], content: str) -> None:
     if config.get('remote_log_enabled', False) is False:
         return
-    
+
     tee_api_endpoint = config.get('tee_api_endpoint')
     prime_api_key = config.get('prime_api_key')
-    
+
     headers = {
         "X-API-Key": prime_api_key
     }
-    requests.post(
-        f"{tee_api_endpoint}/log",
-        headers=headers,
-        json={"proof_key": config['proof_key'], "log_content": content}
-    )
+    # Remote logging is best effort; a failed post must not fail the proof
+    try:
+        http_session.post(
+            f"{tee_api_endpoint}/log",
+            headers=headers,
+            json={"proof_key": config['proof_key'], "log_content": content},
+            timeout=TEE_REQUEST_TIMEOUT
+        )
+    except Exception as e:
+        logging.warning(f"Failed to send remote log: {e}")